@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import discord
 import pathlib
@@ -14,6 +15,7 @@ class Admin(commands.Cog):
     def __init__(self, bot: commands.AutoShardedBot):
         self.bot = bot
         self.logger = logging.getLogger(__name__)
+        self._background_tasks: set[asyncio.Task] = set()
 
     async def cog_load(self):
         self.logger.info("Admin cog loaded")
@@ -72,11 +74,29 @@ class Admin(commands.Cog):
 
     @app_commands.command(name="sync", description="Syncs slash commands.")
     async def sync(self, interaction: discord.Interaction):
-        await self.bot.tree.sync(guild=None)
         await interaction.response.send_message(
-            "Slash commands synced.", ephemeral=True
+            "Syncing slash commands...", ephemeral=True
         )
 
+        # Syncing can take several seconds, answer first and report back later
+        task = asyncio.create_task(self._do_sync(interaction))
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    async def _do_sync(self, interaction: discord.Interaction):
+        """Syncs the command tree and edits the original response with the result."""
+        try:
+            synced = await self.bot.tree.sync(guild=None)
+            content = f"Slash commands synced. ({len(synced)} commands)"
+        except Exception as e:
+            self.logger.error(f"Error syncing slash commands: {e}", exc_info=True)
+            content = f"Error: {e}"
+
+        try:
+            await interaction.edit_original_response(content=content)
+        except discord.HTTPException as e:
+            self.logger.error(f"Unable to report sync result: {e}")
+
     @app_commands.command(name="lvstats", description="Shows Lavalink node stats")
     async def lvstats(self, interaction: discord.Interaction):
         """
@@ -9,6 +9,8 @@ from discord import app_commands
 from discord.ext import commands, tasks
 from config import HAPPI_KEY
 
+_TZ_UTC7 = datetime.timezone(datetime.timedelta(hours=7))  # GMT+7 (Asia/Jakarta)
+
 
 class ExchangeAPI(commands.Cog):
     def __init__(self, bot: commands.AutoShardedBot):
@@ -24,9 +26,7 @@ class ExchangeAPI(commands.Cog):
         self.daily_message.stop()
 
     @tasks.loop(
-        time=datetime.time(
-            hour=8, minute=0, tzinfo=datetime.timezone(datetime.timedelta(hours=7))
-        ),  # GMT+7 (Asia/Jakarta)
+        time=datetime.time(hour=8, minute=0, tzinfo=_TZ_UTC7),
     )
     async def daily_message(self):
         # TODO: add daily message
@@ -52,7 +52,6 @@ class ExchangeAPI(commands.Cog):
         embed = discord.Embed(
             title=f"Exchange Rate ({from_currency} to {to_currency})",
             color=discord.Color.green(),
-            timestamp=discord.utils.utcnow(),
         )
         embed.set_footer(
             text="⚠️ Warning: This is an experimental feature. Use with caution! ⚠️"
@@ -68,7 +67,9 @@ class ExchangeAPI(commands.Cog):
                         data = await response.json()
                         rate = data.get("value")
                         if rate is not None:
-                            embed.description = f"Fetched at: <t:{int(discord.utils.utcnow().timestamp())}:F>\n\n1 {from_currency} = {rate} {to_currency}"
+                            fetched_at = discord.utils.utcnow()
+                            embed.timestamp = fetched_at
+                            embed.description = f"Fetched at: <t:{int(fetched_at.timestamp())}:F>\n\n1 {from_currency} = {rate} {to_currency}"
                             await interaction.followup.send(embed=embed)
                         else:
                             await interaction.followup.send(
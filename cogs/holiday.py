@@ -6,6 +6,8 @@ from discord import app_commands
 from discord.ext import commands
 from datetime import datetime, timedelta
 
+_TZ_JAKARTA = pytz.timezone("Asia/Jakarta")
+
 
 class HolidayPaginator(discord.ui.View):
     def __init__(self, interaction, holidays, page_size=5):
@@ -96,7 +98,7 @@ class Holiday(commands.Cog):
                     for holiday in holidays_data:
                         date_obj = datetime.strptime(
                             holiday["holiday_date"], "%Y-%m-%d"
-                        ).replace(tzinfo=pytz.timezone("Asia/Jakarta"))
+                        ).replace(tzinfo=_TZ_JAKARTA)
                         timestamp = int(date_obj.timestamp())
                         holiday["formatted_date"] = f"<t:{timestamp}:R>"
 
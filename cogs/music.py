@@ -3,24 +3,44 @@ import re
 import json
 import zlib
 import base64
-import random
 import asyncio
 import logging
-import datetime
+import collections
+import functools
+import itertools
 import traceback
 
+from cache import TTLCache
 from database import DatabaseManager
+from dataclasses import dataclass
 from typing import Optional, List
 from views.queue import QueueView
 from views.playlist import PlaylistListView, PlaylistTrackView
 from modals.playlist import ImportPlaylistModal
+from modals.song import AddSongsModal
 from views.song import SongListView
-from config import ADMIN_IDS
 
 import discord
 import wavelink
 from discord import app_commands
-from discord.ext import commands, tasks
+from discord.ext import commands
+
+# Matches playlist/album URLs, which /playnext and /playskip reject
+_PLAYLIST_RE = re.compile(r"[?&]list=|/playlist/|/album/")
+# Matches URLs, whose video and playlist ids are case-sensitive
+_URL_RE = re.compile(r"^https?://", re.IGNORECASE)
+# Matches seek timestamps such as "1m30s", "1m" or "90s"
+_TIMESTAMP_RE = re.compile(r"(?:(\d+)m)?\s*(?:(\d+)s)?", re.IGNORECASE)
+# Playlists with more tracks than this are exported in a worker thread
+_OFFLOAD_ENCODE_THRESHOLD = 200
+
+
+@dataclass(frozen=True, slots=True)
+class _EmbedTemplate:
+    """Constant title and color of an embed, built once at import."""
+
+    title: str
+    color: int
 
 
 class Music(commands.Cog):
@@ -33,6 +53,50 @@ class Music(commands.Cog):
         name="song", description="Song commands", guild_only=True
     )
 
+    _SEARCH_TTL = 300
+    _SEARCH_MAX = 512
+    _AUTOCOMPLETE_DELAY = 0.15
+    _PLAYLIST_SEARCH_CONCURRENCY = 8
+    _PLAYLIST_TTL = 60
+    _PLAYLIST_MAX = 512
+    _PLAYLIST_NAMES_TTL = 30
+    _PLAYLIST_NAMES_MAX = 4096
+    _TRACK_TTL = 3600
+    _TRACK_MAX = 4096
+    _SETTINGS_TTL = 3600
+    _SETTINGS_MAX = 10_000
+
+    _AUTOPLAY_MAP = {
+        "partial": wavelink.AutoPlayMode.partial,
+        "disabled": wavelink.AutoPlayMode.disabled,
+        "enabled": wavelink.AutoPlayMode.enabled,
+    }
+    _LOOP_MAP = {
+        "normal": wavelink.QueueMode.normal,
+        "single": wavelink.QueueMode.loop,
+        "all": wavelink.QueueMode.loop_all,
+    }
+
+    _TRACK_EMBED_BASE = _EmbedTemplate(
+        "Song Added to Queue", discord.Color.blurple().value
+    )
+    _PLAYLIST_EMBED_BASE = _EmbedTemplate(
+        "Playlist Added to Queue", discord.Color.yellow().value
+    )
+    _ERROR_EMBED_BASE = _EmbedTemplate("Error", discord.Color.red().value)
+    _STOPPED_EMBED_BASE = _EmbedTemplate("Player Stopped", discord.Color.red().value)
+    _SKIPPED_EMBED_BASE = _EmbedTemplate(
+        "⏩ Skipped Song", discord.Color.blurple().value
+    )
+    _SHUFFLED_EMBED_BASE = _EmbedTemplate(
+        "Queue Shuffled", discord.Color.blurple().value
+    )
+    _CONNECTED_EMBED_BASE = _EmbedTemplate("Connected", discord.Color.green().value)
+    _DISCONNECTED_EMBED_BASE = _EmbedTemplate(
+        "Disconnected", discord.Color.red().value
+    )
+    _CLEARED_EMBED_BASE = _EmbedTemplate("Queue Cleared", discord.Color.green().value)
+
     def __init__(self, bot: commands.AutoShardedBot):
         """Initializes the Music cog."""
 
@@ -44,6 +108,33 @@ class Music(commands.Cog):
         self.use_yt_music = False
         self.database: DatabaseManager = getattr(bot, "database", None)
 
+        self._health_task: Optional[asyncio.Task] = None
+        # user_id -> (volume, autoplay), kept in sync by /volume and /autoplay
+        self._user_settings_cache = TTLCache(
+            maxsize=self._SETTINGS_MAX, ttl=self._SETTINGS_TTL
+        )
+        self._search_cache = TTLCache(maxsize=self._SEARCH_MAX, ttl=self._SEARCH_TTL)
+        self._choice_cache = TTLCache(maxsize=self._SEARCH_MAX, ttl=self._SEARCH_TTL)
+        # saved track url -> resolved playable, used by /playlist play
+        self._track_cache = TTLCache(maxsize=self._TRACK_MAX, ttl=self._TRACK_TTL)
+        # (owner_id, name) -> playlist row, dropped on delete and rename
+        self._playlist_cache = TTLCache(
+            maxsize=self._PLAYLIST_MAX, ttl=self._PLAYLIST_TTL
+        )
+        # owner_id -> sorted playlist names, serves the playlist autocompletes
+        self._playlist_names_cache = TTLCache(
+            maxsize=self._PLAYLIST_NAMES_MAX, ttl=self._PLAYLIST_NAMES_TTL
+        )
+        self._autocomplete_tasks: dict[int, asyncio.Task] = {}
+        self._pending_searches: dict[tuple, asyncio.Future] = {}
+        self._background_tasks: set[asyncio.Task] = set()
+        # user_id -> latest settings save, later saves wait for it to keep order
+        self._settings_saves: dict[int, asyncio.Task] = {}
+        # guild_id -> lock, dropped when the guild's player disconnects
+        self._play_locks: collections.defaultdict[int, asyncio.Lock] = (
+            collections.defaultdict(asyncio.Lock)
+        )
+
     async def cog_load(self):
         """Called when the cog is loaded."""
         self.logger.info("Cog loaded")
@@ -52,6 +143,8 @@ class Music(commands.Cog):
     async def cog_unload(self):
         """Called when the cog is unloaded."""
         self.logger.info("Cog unloaded")
+        if self._health_task:
+            self._health_task.cancel()
 
     @commands.Cog.listener()
     async def on_voice_state_update(
@@ -96,19 +189,22 @@ class Music(commands.Cog):
                 if not player.paused:
                     await player.pause(True)
                     self.logger.debug(
-                        f"Paused player in {guild.name} due to no human members in voice channel"
+                        "Paused player in %s due to no human members in voice channel",
+                        guild.name,
                     )
             elif player.connected:
-                await player.disconnect()
+                await self._disconnect_player(player)
                 self.logger.debug(
-                    f"Disconnected player in {guild.name} due to no human members in voice channel"
+                    "Disconnected player in %s due to no human members in voice channel",
+                    guild.name,
                 )
         else:
             # bot is not alone
             if player.paused:
                 await player.pause(False)
                 self.logger.debug(
-                    f"Resumed player in {guild.name} due to human members in voice channel"
+                    "Resumed player in %s due to human members in voice channel",
+                    guild.name,
                 )
 
     @commands.Cog.listener()
@@ -116,15 +212,17 @@ class Music(commands.Cog):
         """Event listener for when a Wavelink node is ready."""
         node = payload.node
         resumed = payload.resumed
-        self.logger.debug(f"Wavelink Node connected: {node} | Resumed: {resumed}")
+        self.logger.debug("Wavelink Node connected: %s | Resumed: %s", node, resumed)
 
     @commands.Cog.listener()
     async def on_wavelink_inactive_player(self, player: wavelink.Player) -> None:
         """Event listener for when a Wavelink player becomes inactive."""
         self.logger.debug(
-            f"Player {player} is inactive for {player.inactive_timeout} seconds. Disconnecting."
+            "Player %s is inactive for %s seconds. Disconnecting.",
+            player,
+            player.inactive_timeout,
         )
-        await player.disconnect()
+        await self._disconnect_player(player)
 
     @commands.Cog.listener()
     async def on_wavelink_track_start(
@@ -133,7 +231,7 @@ class Music(commands.Cog):
         """Event listener for when a Wavelink track starts playing."""
         track = payload.track
         player = payload.player
-        self.logger.debug(f"Track started: {track} on player {player}")
+        self.logger.debug("Track started: %s on player %s", track, player)
 
     @commands.Cog.listener()
     async def on_wavelink_track_exception(
@@ -156,61 +254,110 @@ class Music(commands.Cog):
                     password="youshallnotpass",
                 )
                 self.nodes.append(node)
-                self.logger.debug(f"Added local Lavalink node: {node.identifier}")
+                self.logger.debug("Added local Lavalink node: %s", node.identifier)
 
-            await wavelink.node.Pool.connect(
-                nodes=self.nodes, client=self.bot, cache_capacity=100
-            )
+            # Pool.connect handshakes its nodes one after another, so connect
+            # each node on its own to make the total time the slowest node.
+            await asyncio.gather(*(self._connect_node(node) for node in self.nodes))
             self.logger.info("Lavalink connection setup complete.")
         except Exception as e:
             self.logger.error(f"Error setting up Lavalink: {e}", exc_info=True)
             raise
 
+        if not self._health_task or self._health_task.done():
+            self._health_task = asyncio.create_task(self._node_health())
+
+    async def _connect_node(self, node: wavelink.Node, attempts: int = 5):
+        """Connects a single Lavalink node, retrying with exponential backoff."""
+        backoff = 0.5
+
+        for attempt in range(1, attempts + 1):
+            try:
+                await asyncio.wait_for(
+                    wavelink.node.Pool.connect(
+                        nodes=[node], client=self.bot, cache_capacity=100
+                    ),
+                    timeout=10,
+                )
+                return
+            except Exception as e:
+                if attempt == attempts:
+                    raise
+                self.logger.warning(
+                    f"Failed to connect Lavalink node {node.identifier} "
+                    f"(attempt {attempt}/{attempts}), retrying in {backoff}s: {e}"
+                )
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, 8)
+
+    async def _node_health(self):
+        """Periodically reconnects Lavalink nodes that dropped their websocket."""
+        backoff = 1
+
+        while True:
+            await asyncio.sleep(30)
+
+            while any(
+                node.status != wavelink.NodeStatus.CONNECTED
+                for node in wavelink.node.Pool.nodes.values()
+            ):
+                self.logger.warning(
+                    f"Lavalink node disconnected, reconnecting in {backoff}s"
+                )
+                await asyncio.sleep(backoff)
+
+                try:
+                    await wavelink.node.Pool.reconnect()
+                except Exception as e:
+                    self.logger.error(f"Error reconnecting Lavalink nodes: {e}")
+
+                backoff = min(backoff * 2, 60)
+
+            backoff = 1
+
     @staticmethod
     def convert_timestamp_to_milliseconds(timestamp: str) -> int:
-        """Converts a timestamp string (e.g., '1m30s', '90s') to milliseconds using regex."""
-        timestamp = timestamp.lower()
-        minutes_match = re.search(r"(\d+)m", timestamp)
-        seconds_match = re.search(r"(\d+)s", timestamp)
+        """Converts a timestamp string (e.g., '1m30s', '90s', '90') to milliseconds using regex."""
+        timestamp = timestamp.strip()
+        if timestamp.isdigit():
+            return int(timestamp) * 1000
+
+        # "90s" is the other common shape, it needs no regex either
+        seconds = timestamp[:-1]
+        if timestamp[-1:] in ("s", "S") and seconds.isdigit():
+            return int(seconds) * 1000
+
+        match = _TIMESTAMP_RE.fullmatch(timestamp)
 
-        if not minutes_match and not seconds_match:
+        if not match or not (match.group(1) or match.group(2)):
             raise ValueError("Invalid timestamp format")
 
-        minutes = int(minutes_match.group(1)) if minutes_match else 0
-        seconds = int(seconds_match.group(1)) if seconds_match else 0
+        minutes, seconds = match.groups(0)
 
-        return (minutes * 60 + seconds) * 1000
+        return (int(minutes) * 60 + int(seconds)) * 1000
 
     @staticmethod
+    @functools.lru_cache(maxsize=4096)
     def format_duration(milliseconds: int) -> str:
         """Formats milliseconds into a readable duration string (mm:ss or ss)."""
         seconds = milliseconds // 1000
+        if seconds < 60:
+            return f"{seconds}s"
+
         minutes, seconds = divmod(seconds, 60)
-        if minutes:
-            return f"{minutes}m{seconds:02}s"  # Ensure seconds are always two digits if minutes exist
-        return f"{seconds}s"
+        return f"{minutes}m{seconds:02}s"  # Ensure seconds are always two digits if minutes exist
 
     @staticmethod
-    def convert_autoplay_mode(mode_string: str) -> Optional[wavelink.AutoPlayMode]:
+    def convert_autoplay_mode(mode_string: str) -> wavelink.AutoPlayMode:
         """Converts a string to a wavelink.AutoPlayMode enum member."""
-        mode_string = str(mode_string).lower()
-        mode_map = {
-            "partial": wavelink.AutoPlayMode.partial,
-            "disabled": wavelink.AutoPlayMode.disabled,
-            "enabled": wavelink.AutoPlayMode.enabled,
-        }
-        return mode_map.get(mode_string, wavelink.AutoPlayMode.partial)
+        return Music._AUTOPLAY_MAP.get(
+            str(mode_string).lower(), wavelink.AutoPlayMode.partial
+        )
 
     @staticmethod
-    def convert_loop_mode(mode_string: str) -> Optional[wavelink.QueueMode]:
+    def convert_loop_mode(mode_string: str) -> wavelink.QueueMode:
         """Converts a string to a wavelink.QueueMode enum member."""
-        mode_string = str(mode_string).lower()
-        mode_map = {
-            "normal": wavelink.QueueMode.normal,
-            "single": wavelink.QueueMode.loop,
-            "all": wavelink.QueueMode.loop_all,
-        }
-        return mode_map.get(mode_string, wavelink.QueueMode.normal)
+        return Music._LOOP_MAP.get(str(mode_string).lower(), wavelink.QueueMode.normal)
 
     @staticmethod
     def milliseconds_to_hms_string(milliseconds):
@@ -243,12 +390,7 @@ class Music(commands.Cog):
     ):
         """Sends an error embed to the interaction."""
 
-        embed = discord.Embed(
-            title="Error",
-            description=message,
-            color=discord.Color.red(),
-            timestamp=discord.utils.utcnow(),
-        )
+        embed = self._template_embed(self._ERROR_EMBED_BASE, message)
         try:
             if interaction.response.is_done():
                 await interaction.followup.send(embed=embed, ephemeral=ephemeral)
@@ -306,14 +448,54 @@ class Music(commands.Cog):
         except Exception as e:
             self.logger.exception(f"Error sending embed: {e}")
 
-    async def _get_player(
+    async def _check_voice(
+        self, interaction: discord.Interaction, player: Optional[wavelink.Player]
+    ) -> bool:
+        """Checks that a player exists or the user is in a voice channel.
+
+        Sends an error and returns False otherwise, before any deferral or Lavalink search.
+        """
+        if player:
+            return True
+
+        if interaction.user.voice and interaction.user.voice.channel:
+            return True
+
+        await self._send_error_as_embed(
+            interaction,
+            "You need to be in a voice channel to use this command.",
+            ephemeral=True,
+        )
+        return False
+
+    async def _require_player(
         self, interaction: discord.Interaction
+    ) -> Optional[wavelink.Player]:
+        """Returns the guild's player, or tells the user there is none and returns None."""
+        player: Optional[wavelink.Player] = interaction.guild.voice_client
+        if player:
+            return player
+
+        message = "There is no music playing or player not connected"
+        if interaction.response.is_done():
+            await interaction.followup.send(message, ephemeral=True)
+        else:
+            await interaction.response.send_message(message, ephemeral=True)
+        return None
+
+    async def _get_player(
+        self,
+        interaction: discord.Interaction,
+        existing_player: Optional[wavelink.Player] = None,
     ) -> Optional[wavelink.Player]:
         """Retrieves the player or connects to the voice channel if necessary.
 
         Returns the player if connected, otherwise sends an error and returns None.
+        A voice client the caller has already read can be passed as existing_player.
         """
-        player: Optional[wavelink.Player] = interaction.guild.voice_client
+        player: Optional[wavelink.Player] = (
+            existing_player or interaction.guild.voice_client
+        )
         if player:
             return player
 
@@ -331,7 +513,9 @@ class Music(commands.Cog):
         try:
             player = await voice_channel.connect(cls=wavelink.Player, self_deaf=True)
             self.logger.debug(
-                f"Connected player to voice channel: {voice_channel.id}, {voice_channel.name}"
+                "Connected player to voice channel: %s, %s",
+                voice_channel.id,
+                voice_channel.name,
             )
             return player
         except Exception as e:
@@ -346,24 +530,27 @@ class Music(commands.Cog):
     async def _get_user_settings(
         self, user_id: int
     ) -> tuple[int, wavelink.AutoPlayMode]:
-        """Retrieves user settings from the database or defaults."""
+        """Retrieves user settings from the cache, the database or defaults."""
         default_volume = 30
         default_autoplay = wavelink.AutoPlayMode.partial
 
+        cached = self._user_settings_cache.get(user_id)
+        if cached:
+            volume, autoplay = cached
+            return volume, Music.convert_autoplay_mode(autoplay)
+
         if not self.database:
             return default_volume, default_autoplay
 
         try:
-            user_settings = await self.database.member.get(user_id)
+            user_settings = await self.database.member.get_or_create(
+                user_id, volume=default_volume, autoplay="partial"
+            )
             if user_settings:
-                return user_settings.get(
-                    "volume", default_volume
-                ), Music.convert_autoplay_mode(user_settings.get("autoplay", "partial"))
+                volume = user_settings.get("volume", default_volume)
+                autoplay = user_settings.get("autoplay", "partial")
             else:
-                await self.database.member.create(
-                    user_id, volume=default_volume, autoplay="partial"
-                )
-                return default_volume, default_autoplay
+                volume, autoplay = default_volume, "partial"
         except Exception as e:
             self.logger.error(
                 f"[DATABASE] Error getting user settings for user {user_id}: {e}",
@@ -371,13 +558,123 @@ class Music(commands.Cog):
             )
             return default_volume, default_autoplay  # Return defaults on error
 
+        self._user_settings_cache.set(user_id, (volume, autoplay))
+
+        return volume, Music.convert_autoplay_mode(autoplay)
+
+    def _update_cached_user_settings(
+        self,
+        user_id: int,
+        volume: Optional[int] = None,
+        autoplay: Optional[str] = None,
+    ) -> None:
+        """Updates the cached settings of a user, if they are cached."""
+        cached = self._user_settings_cache.get(user_id)
+        if not cached:
+            return
+
+        self._user_settings_cache.set(
+            user_id,
+            (
+                cached[0] if volume is None else volume,
+                cached[1] if autoplay is None else autoplay,
+            ),
+        )
+
+    async def _save_user_settings(
+        self,
+        user_id: int,
+        volume: Optional[int] = None,
+        autoplay: Optional[str] = None,
+        previous: Optional[asyncio.Task] = None,
+    ) -> None:
+        """Persists changed user settings, the cache is updated by the caller.
+
+        Waits for the previous save of the user first, so an older value never
+        overwrites a newer one.
+        """
+        if previous:
+            await asyncio.wait((previous,))
+        try:
+            await self.database.member.upsert(user_id, volume=volume, autoplay=autoplay)
+        except Exception as e:
+            self.logger.error(
+                f"[DATABASE] Unable to save settings for user {user_id}: {e}"
+            )
+            # Drop the entry so the next lookup reloads the stored values
+            self._user_settings_cache.pop(user_id, None)
+
+    def _queue_user_settings_save(
+        self,
+        user_id: int,
+        volume: Optional[int] = None,
+        autoplay: Optional[str] = None,
+    ) -> None:
+        """Saves user settings in the background, after the user's earlier saves."""
+        task = self._create_background_task(
+            self._save_user_settings(
+                user_id, volume, autoplay, self._settings_saves.get(user_id)
+            )
+        )
+        self._settings_saves[user_id] = task
+
+        def forget(_: asyncio.Task) -> None:
+            if self._settings_saves.get(user_id) is task:
+                del self._settings_saves[user_id]
+
+        task.add_done_callback(forget)
+
+    def _search_cache_key(
+        self, query: str
+    ) -> tuple[wavelink.TrackSource, tuple[wavelink.TrackSource, str]]:
+        """Returns the current search source and the cache key for a query.
+
+        Free-text queries are lowercased, URLs keep their case.
+        """
+        source = (
+            wavelink.TrackSource.YouTubeMusic
+            if self.use_yt_music
+            else wavelink.TrackSource.YouTube
+        )
+        query = query.strip()
+        if not _URL_RE.match(query):
+            query = query.lower()
+        return source, (source, query)
+
     async def _search_tracks(self, query: str) -> Optional[wavelink.Search]:
-        """Searches for tracks using wavelink.Playable.search and handles errors."""
+        """Searches for tracks using wavelink.Playable.search and handles errors.
+
+        Results are cached per search source and normalized query for a few minutes.
+        """
+        source, cache_key = self._search_cache_key(query)
+
+        cached: Optional[wavelink.Search] = self._search_cache.get(cache_key)
+        if cached:
+            return cached
+
+        # Concurrent searches for the same query share one Lavalink request,
+        # shielded so a cancelled autocomplete doesn't cancel it for the others
+        pending = self._pending_searches.get(cache_key)
+        if pending is None:
+            pending = asyncio.ensure_future(
+                self._fetch_search(query, source, cache_key)
+            )
+            self._pending_searches[cache_key] = pending
+            pending.add_done_callback(
+                lambda _: self._pending_searches.pop(cache_key, None)
+            )
+        return await asyncio.shield(pending)
+
+    async def _fetch_search(
+        self, query: str, source: wavelink.TrackSource, cache_key: tuple
+    ) -> Optional[wavelink.Search]:
+        """Runs a Lavalink search and caches non-empty results."""
         try:
             tracks: wavelink.Search = await wavelink.Playable.search(
-                query, 
-                source=wavelink.TrackSource.YouTubeMusic if self.use_yt_music else wavelink.TrackSource.YouTube
+                query, source=source
             )
+            if tracks:
+                self._search_cache.set(cache_key, tracks)
             return tracks
         except Exception as e:
             self.logger.error(
@@ -385,34 +682,70 @@ class Music(commands.Cog):
             )
             return None
 
+    async def _resolve_track(self, url: str) -> Optional[wavelink.Playable]:
+        """Resolves a saved track URL to its first playable, cached per URL.
+
+        Kept apart from the search cache so large playlists don't evict /play searches.
+        """
+        track: Optional[wavelink.Playable] = self._track_cache.get(url)
+        if track is not None:
+            return track
+
+        source, _ = self._search_cache_key(url)
+        try:
+            tracks: wavelink.Search = await wavelink.Playable.search(url, source=source)
+        except Exception as e:
+            self.logger.error(
+                f"Error during track search for url '{url}': {e}", exc_info=True
+            )
+            return None
+
+        if not tracks:
+            return None
+
+        track = tracks[0]
+        self._track_cache.set(url, track)
+        return track
+
+    @staticmethod
+    def _template_embed(
+        template: _EmbedTemplate,
+        description: str,
+        artwork: Optional[str] = None,
+        url: Optional[str] = None,
+    ) -> discord.Embed:
+        """Builds an embed from one of the embed templates."""
+        embed = discord.Embed(
+            title=template.title,
+            color=template.color,
+            description=description,
+            url=url,
+            timestamp=discord.utils.utcnow(),
+        )
+        if artwork:
+            embed.set_thumbnail(url=artwork)
+        return embed
+
     def _create_track_embed(
         self, track: wavelink.Playable, queue_position_text: str
     ) -> discord.Embed:
         """Creates a standardized embed for a track being added to the queue."""
-        embed = discord.Embed(
-            title="Song Added to Queue",
-            description=f"[{track.title}]({track.uri}) by **{track.author}** added {queue_position_text}.",
-            color=discord.Color.blurple(),
-            timestamp=discord.utils.utcnow(),
+        return self._template_embed(
+            self._TRACK_EMBED_BASE,
+            f"[{track.title}]({track.uri}) by **{track.author}** added {queue_position_text}.",
+            artwork=track.artwork,
             url=track.uri,
         )
-        if track.artwork:
-            embed.set_thumbnail(url=track.artwork)
-        return embed
 
     def _create_playlist_embed(
         self, playlist: wavelink.Playlist, added_count: int
     ) -> discord.Embed:
         """Creates a standardized embed for a playlist being added to the queue."""
-        embed = discord.Embed(
-            title="Playlist Added to Queue",
-            description=f"**`{playlist.name}`** ({added_count} songs) added.",
-            color=discord.Color.yellow(),
-            timestamp=discord.utils.utcnow(),
+        return self._template_embed(
+            self._PLAYLIST_EMBED_BASE,
+            f"**`{playlist.name}`** ({added_count} songs) added.",
+            artwork=playlist.artwork,
         )
-        if playlist.artwork:
-            embed.set_thumbnail(url=playlist.artwork)
-        return embed
 
     async def _enqueue_track(
         self,
@@ -420,52 +753,97 @@ class Music(commands.Cog):
         query: str,
         play_next: bool = False,
         play_skip: bool = False,
+        existing_player: Optional[wavelink.Player] = None,
     ):
         """Handles the track enqueueing and playing logic, used by /play, /playnext, and /playskip"""
-        player: Optional[wavelink.Player] = await self._get_player(interaction)
+        if (play_next or play_skip) and _PLAYLIST_RE.search(query):
+            await self._send_error_as_embed(
+                interaction,
+                f"Playlists cannot be added to the play{'next' if play_next else 'skip'} queue.",
+                True,
+            )
+            return
+
+        # The voice connect, settings lookup and Lavalink search are independent,
+        # running them together costs the slowest of the three instead of the sum
+        player, (volume, autoplay_mode), tracks = await asyncio.gather(
+            self._get_player(interaction, existing_player),
+            self._get_user_settings(interaction.user.id),
+            self._search_tracks(query),
+        )
         if not player:
             return
 
-        volume, autoplay_mode = await self._get_user_settings(interaction.user.id)
         player.autoplay = autoplay_mode
 
-        tracks: Optional[wavelink.Search] = await self._search_tracks(query)
         if not tracks:
             await self._send_error_as_embed(
                 interaction, f"No tracks found for query: `{query}`.", True
             )
             return
 
-        if isinstance(tracks, wavelink.Playlist):
-            if play_next or play_skip:
-                await self._send_error_as_embed(
-                    interaction,
-                    f"Playlists cannot be added to the play{'next' if play_next else 'skip'} queue.",
-                    True,
-                )
-                return
-            added_count = await player.queue.put_wait(tracks)
-            embed = self._create_playlist_embed(tracks, added_count)
-        else:
-            track: wavelink.Playable = tracks[0]
-            if play_next:
-                player.queue.put_at(0, track)  # Insert after current track
-                queue_position_text = "after the current song"
-            elif play_skip:
-                player.queue.put_at(0, track)  # Insert at skip position
-                queue_position_text = "skipping the current song"
+        # Fallback for playlist sources the URL pattern does not catch
+        if isinstance(tracks, wavelink.Playlist) and (play_next or play_skip):
+            await self._send_error_as_embed(
+                interaction,
+                f"Playlists cannot be added to the play{'next' if play_next else 'skip'} queue.",
+                True,
+            )
+            return
+
+        # Serialise queueing and starting playback per guild, so concurrent
+        # /play calls cannot both see an idle player and start different tracks
+        async with self._play_locks[interaction.guild_id]:
+            if isinstance(tracks, wavelink.Playlist):
+                # Queue the first track now so playback can start right away,
+                # the rest of the playlist is queued in the background
+                first, *rest = tracks.tracks
+                await player.queue.put_wait(first)
+                if rest:
+                    self._create_background_task(self._enqueue_rest(player, rest))
+                embed = self._create_playlist_embed(tracks, len(tracks.tracks))
             else:
-                await player.queue.put_wait(track)
-                queue_position_text = "to the queue"
-            embed = self._create_track_embed(track, queue_position_text)
+                track: wavelink.Playable = tracks[0]
+                if play_next:
+                    player.queue.put_at(0, track)  # Insert after current track
+                    queue_position_text = "after the current song"
+                elif play_skip:
+                    player.queue.put_at(0, track)  # Insert at skip position
+                    queue_position_text = "skipping the current song"
+                else:
+                    await player.queue.put_wait(track)
+                    queue_position_text = "to the queue"
+                embed = self._create_track_embed(track, queue_position_text)
+
+            if not player.playing:
+                await player.play(player.queue.get(), volume=volume)
+
+            if player.playing and play_skip:
+                await player.skip(force=True)
 
         await self._send_embed(interaction, embed)
 
-        if not player.playing:
-            await player.play(player.queue.get(), volume=volume)
+    async def _enqueue_rest(
+        self, player: wavelink.Player, tracks: List[wavelink.Playable]
+    ):
+        """Adds the remaining tracks of a playlist to the player's queue."""
+        try:
+            await player.queue.put_wait(tracks)
+        except Exception as e:
+            self.logger.error(f"Error queueing playlist tracks: {e}", exc_info=True)
+
+    async def _disconnect_player(self, player: wavelink.Player) -> None:
+        """Disconnects a player and drops the per-guild state kept for it."""
+        guild_id = player.guild.id if player.guild else None
+        await player.disconnect()
+        self._play_locks.pop(guild_id, None)
 
-        if player.playing and play_skip:
-            await player.skip(force=True)
+    def _create_background_task(self, coro) -> asyncio.Task:
+        """Schedules a coroutine and keeps a reference to it until it is done."""
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+        return task
 
     @app_commands.command(
         name="play", description="Play a song given a URL or a search query."
@@ -473,16 +851,26 @@ class Music(commands.Cog):
     @app_commands.guild_only()
     @app_commands.describe(query="The query to play.")
     async def play(self, interaction: discord.Interaction, query: str):
+        player: Optional[wavelink.Player] = interaction.guild.voice_client
+        if not await self._check_voice(interaction, player):
+            return
+
         await interaction.response.defer()
-        await self._enqueue_track(interaction, query)
+        await self._enqueue_track(interaction, query, existing_player=player)
 
     @app_commands.command(
         name="playnext", description="Plays the song after the current song."
     )
     @app_commands.guild_only()
     async def playnext(self, interaction: discord.Interaction, query: str):
+        player: Optional[wavelink.Player] = interaction.guild.voice_client
+        if not await self._check_voice(interaction, player):
+            return
+
         await interaction.response.defer()
-        await self._enqueue_track(interaction, query, play_next=True)
+        await self._enqueue_track(
+            interaction, query, play_next=True, existing_player=player
+        )
 
     @app_commands.command(
         name="playskip",
@@ -490,45 +878,79 @@ class Music(commands.Cog):
     )
     @app_commands.guild_only()
     async def playskip(self, interaction: discord.Interaction, query: str):
+        player: Optional[wavelink.Player] = interaction.guild.voice_client
+        if not await self._check_voice(interaction, player):
+            return
+
         await interaction.response.defer()
-        await self._enqueue_track(interaction, query, play_skip=True)
+        await self._enqueue_track(
+            interaction, query, play_skip=True, existing_player=player
+        )
 
+    @play.autocomplete(name="query")
+    @playnext.autocomplete(name="query")
+    @playskip.autocomplete(name="query")
     async def _autocomplete_query(
         self, interaction: discord.Interaction, query: str
     ) -> List[app_commands.Choice[str]]:
-        """Reusable autocomplete function for track queries."""
+        """Reusable autocomplete function for track queries.
+
+        Keystrokes are debounced per user, a newer keystroke in any query field
+        cancels the pending search of the previous one.
+        """
         if not query or len(query) < 3:
             return []
 
+        # Cached choices need no debounce, they cost no Lavalink request
+        _, cache_key = self._search_cache_key(query)
+        cached = self._choice_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        key = interaction.user.id
+        pending = self._autocomplete_tasks.get(key)
+        if pending:
+            pending.cancel()
+
+        task = asyncio.create_task(self._debounced_autocomplete(query))
+        self._autocomplete_tasks[key] = task
+        try:
+            await asyncio.wait({task})
+        finally:
+            if self._autocomplete_tasks.get(key) is task:
+                del self._autocomplete_tasks[key]
+
+        if task.cancelled():
+            return []
+        return task.result()
+
+    async def _debounced_autocomplete(
+        self, query: str
+    ) -> List[app_commands.Choice[str]]:
+        """Waits out the debounce delay, then returns the choices for the query."""
+        await asyncio.sleep(self._AUTOCOMPLETE_DELAY)
+        return await self._search_choices(query)
+
+    async def _search_choices(self, query: str) -> List[app_commands.Choice[str]]:
+        """Searches for tracks and builds autocomplete choices, cached per query."""
+        _, cache_key = self._search_cache_key(query)
+
         tracks: Optional[wavelink.Search] = await self._search_tracks(query)
         if not tracks:
             return []
 
+        # Discord shows at most 25 choices, stop as soon as that many are usable
         choices: List[app_commands.Choice[str]] = []
-        for track in tracks[:25]:
+        for track in tracks:
             if isinstance(track, wavelink.Playable):
                 choices.append(
-                    app_commands.Choice(name=f"{track.title[:80]}", value=track.uri)
+                    app_commands.Choice(name=track.title[:80], value=track.uri)
                 )
-        return choices
-
-    @play.autocomplete(name="query")
-    async def play_autocomplete(
-        self, interaction: discord.Interaction, query: str
-    ) -> list[app_commands.Choice[str]]:
-        return await self._autocomplete_query(interaction, query)
+                if len(choices) == 25:
+                    break
 
-    @playnext.autocomplete(name="query")
-    async def playnext_autocomplete(
-        self, interaction: discord.Interaction, query: str
-    ) -> list[app_commands.Choice[str]]:
-        return await self._autocomplete_query(interaction, query)
-
-    @playskip.autocomplete(name="query")
-    async def playskip_autocomplete(
-        self, interaction: discord.Interaction, query: str
-    ) -> list[app_commands.Choice[str]]:
-        return await self._autocomplete_query(interaction, query)
+        self._choice_cache.set(cache_key, choices)
+        return choices
 
     @app_commands.command(name="stop", description="Stops the player.")
     @app_commands.guild_only()
@@ -551,13 +973,10 @@ class Music(commands.Cog):
             player.queue.reset()
 
         await player.stop(force=True)
-        await player.disconnect()
+        await self._disconnect_player(player)
 
-        embed = discord.Embed(
-            title="Player Stopped",
-            description="🛑 Stopped the player and cleared the queue.",
-            color=discord.Color.red(),
-            timestamp=discord.utils.utcnow(),
+        embed = self._template_embed(
+            self._STOPPED_EMBED_BASE, "🛑 Stopped the player and cleared the queue."
         )
         await interaction.response.send_message(embed=embed, ephemeral=True)
 
@@ -581,13 +1000,9 @@ class Music(commands.Cog):
 
         await player.skip(force=True)
 
-        embed = discord.Embed(
-            title=f"⏩ Skipped Song",
-            description="Skipped the current song.",
-            color=discord.Color.blurple(),
-            timestamp=discord.utils.utcnow(),
+        embed = self._template_embed(
+            self._SKIPPED_EMBED_BASE, "Skipped the current song."
         )
-
         await interaction.response.send_message(embed=embed, ephemeral=True)
 
     async def _handle_pause_resume(
@@ -646,7 +1061,7 @@ class Music(commands.Cog):
         name="seek", description="Seek current song to a specific timestamp."
     )
     @app_commands.guild_only()
-    @app_commands.describe(timestamp="The timestamp to seek to. (e.g., 1s, 1m1s etc.)")
+    @app_commands.describe(timestamp="The timestamp to seek to. (e.g., 90, 1s, 1m1s etc.)")
     async def seek(self, interaction: discord.Interaction, timestamp: str):
         player: wavelink.Player = interaction.guild.voice_client
 
@@ -658,10 +1073,10 @@ class Music(commands.Cog):
 
         # Convert timestamp string to milliseconds
         try:
-            milliseconds = self.convert_timestamp_to_milliseconds(timestamp)
+            milliseconds = Music.convert_timestamp_to_milliseconds(timestamp)
         except ValueError:
             await interaction.response.send_message(
-                "Invalid timestamp format. Please use format like '1m30s', '90s', etc.",
+                "Invalid timestamp format. Please use format like '1m30s', '90s', '90', etc.",
                 ephemeral=True,
             )
             return
@@ -684,29 +1099,19 @@ class Music(commands.Cog):
         # Seek to position
         await player.seek(milliseconds)
         await interaction.response.send_message(
-            f"Seeked to {self.format_duration(milliseconds)}"
+            f"Seeked to `{timestamp.strip()}`"
         )
 
     @app_commands.command(name="shuffle", description="Shuffles the queue.")
     @app_commands.guild_only()
     async def shuffle(self, interaction: discord.Interaction):
-        player: wavelink.Player = interaction.guild.voice_client
-
+        player: Optional[wavelink.Player] = await self._require_player(interaction)
         if not player:
-            await interaction.response.send_message(
-                "There is no music playing or player not connected", ephemeral=True
-            )
             return
 
         player.queue.shuffle()
 
-        embed = discord.Embed(
-            title="Queue Shuffled",
-            description="🔀 Shuffled the queue.",
-            color=discord.Color.blurple(),
-            timestamp=discord.utils.utcnow(),
-        )
-
+        embed = self._template_embed(self._SHUFFLED_EMBED_BASE, "🔀 Shuffled the queue.")
         await interaction.response.send_message(embed=embed, ephemeral=True)
 
     @app_commands.command(name="loop", description="Sets the loop state.")
@@ -721,15 +1126,12 @@ class Music(commands.Cog):
     async def loop(
         self, interaction: discord.Interaction, state: app_commands.Choice[str]
     ):
-        player: wavelink.Player = interaction.guild.voice_client
-
+        player: Optional[wavelink.Player] = await self._require_player(interaction)
         if not player:
-            await interaction.response.send_message(
-                "There is no music playing or player not connected", ephemeral=True
-            )
             return
 
-        wavelink.Queue.mode = self.convert_loop_mode(state.value)
+        # Choice values are already the lowercase map keys
+        player.queue.mode = self._LOOP_MAP.get(state.value, wavelink.QueueMode.normal)
 
         embed = discord.Embed(
             title="Loop State Changed",
@@ -743,23 +1145,21 @@ class Music(commands.Cog):
     @app_commands.guild_only()
     @app_commands.describe(volume="The volume to set (0-1000)")
     async def volume(self, interaction: discord.Interaction, volume: int):
-        player: wavelink.Player = interaction.guild.voice_client
-
+        player: Optional[wavelink.Player] = await self._require_player(interaction)
         if not player:
-            await interaction.response.send_message(
-                "There is no music playing or player not connected", ephemeral=True
-            )
             return
 
         volume = max(0, min(1000, volume))  # Clamp volume to 0-1000
 
-        # database update
-        try:
-            await self.database.member.update(interaction.user.id, volume=volume)
-        except Exception as e:
-            self.logger.error(f"Unable to update volume in database: {e}")
+        # Apply the volume first, the database write must not delay playback
+        if player.volume != volume:
+            await player.set_volume(volume)
 
-        await player.set_volume(volume)
+        # database update, skipped when the cached value is already the same
+        cached = self._user_settings_cache.get(interaction.user.id)
+        if not cached or cached[0] != volume:
+            self._update_cached_user_settings(interaction.user.id, volume=volume)
+            self._queue_user_settings_save(interaction.user.id, volume=volume)
 
         embed = discord.Embed(
             title="Volume Changed",
@@ -781,20 +1181,19 @@ class Music(commands.Cog):
     async def autoplay(
         self, interaction: discord.Interaction, state: app_commands.Choice[str]
     ):
-        player: wavelink.Player = interaction.guild.voice_client
-
+        player: Optional[wavelink.Player] = await self._require_player(interaction)
         if not player:
-            await interaction.response.send_message(
-                "There is no music playing or player not connected", ephemeral=True
-            )
             return
 
-        player.autoplay = self.convert_autoplay_mode(state.value)
+        # Choice values are already the lowercase map keys
+        player.autoplay = self._AUTOPLAY_MAP.get(
+            state.value, wavelink.AutoPlayMode.partial
+        )
 
-        try:
-            await self.database.member.update(interaction.user.id, autoplay=state.value)
-        except Exception as e:
-            self.logger.error(f"Unable to save autoplaymode in database: {e}")
+        cached = self._user_settings_cache.get(interaction.user.id)
+        if not cached or cached[1] != state.value:
+            self._update_cached_user_settings(interaction.user.id, autoplay=state.value)
+            self._queue_user_settings_save(interaction.user.id, autoplay=state.value)
 
         embed = discord.Embed(
             title="Autoplay Changed",
@@ -807,18 +1206,14 @@ class Music(commands.Cog):
     @app_commands.command(name="connect", description="Connect to the voice channel.")
     @app_commands.guild_only()
     async def connect(self, interaction: discord.Interaction):
-        player: wavelink.Player = (
-            interaction.guild.voice_client or await self._get_player(interaction)
-        )
+        player: Optional[wavelink.Player] = await self._get_player(interaction)
 
         if not player:
             return
 
-        embed = discord.Embed(
-            title="Connected",
-            description=f"👋 Connected to voice channel {player.channel.mention}",
-            color=discord.Color.green(),
-            timestamp=discord.utils.utcnow(),
+        embed = self._template_embed(
+            self._CONNECTED_EMBED_BASE,
+            f"👋 Connected to voice channel {player.channel.mention}",
         )
         await interaction.response.send_message(embed=embed, ephemeral=True)
 
@@ -838,33 +1233,22 @@ class Music(commands.Cog):
     @app_commands.command(name="disconnect", description="Disconnects the player.")
     @app_commands.guild_only()
     async def disconnect(self, interaction: discord.Interaction):
-        player: wavelink.Player = interaction.guild.voice_client
-
+        player: Optional[wavelink.Player] = await self._require_player(interaction)
         if not player:
-            await interaction.response.send_message(
-                "There is no music playing or player not connected", ephemeral=True
-            )
             return
 
-        await player.disconnect()
+        await self._disconnect_player(player)
 
-        embed = discord.Embed(
-            title="Disconnected",
-            description="👋 Disconnected from voice channel",
-            color=discord.Color.red(),
-            timestamp=discord.utils.utcnow(),
+        embed = self._template_embed(
+            self._DISCONNECTED_EMBED_BASE, "👋 Disconnected from voice channel"
         )
         await interaction.response.send_message(embed=embed, ephemeral=True)
 
     @app_commands.command(name="queue", description="Displays the current queue.")
     @app_commands.guild_only()
     async def queue(self, interaction: discord.Interaction):
-        player: wavelink.Player = interaction.guild.voice_client
-
+        player: Optional[wavelink.Player] = await self._require_player(interaction)
         if not player:
-            await interaction.response.send_message(
-                "There is no music playing or player not connected", ephemeral=True
-            )
             return
 
         view = QueueView(player)
@@ -875,20 +1259,13 @@ class Music(commands.Cog):
     @app_commands.command(name="clear", description="Clears the queue.")
     @app_commands.guild_only()
     async def clear(self, interaction: discord.Interaction):
-        player: wavelink.Player = interaction.guild.voice_client
-
+        player: Optional[wavelink.Player] = await self._require_player(interaction)
         if not player:
-            await interaction.response.send_message(
-                "There is no music playing or player not connected", ephemeral=True
-            )
             return
 
         player.queue.clear()
-        embed = discord.Embed(
-            title="Queue Cleared",
-            description=f"🗑️ Queue cleared by {interaction.user.mention}",
-            color=discord.Color.green(),
-            timestamp=discord.utils.utcnow(),
+        embed = self._template_embed(
+            self._CLEARED_EMBED_BASE, f"🗑️ Queue cleared by {interaction.user.mention}"
         )
         await interaction.response.send_message(embed=embed, ephemeral=True)
 
@@ -958,6 +1335,7 @@ class Music(commands.Cog):
             await self.database.playlist.create(
                 interaction.user.id, name, description, public=public
             )
+            self._playlist_names_cache.pop(interaction.user.id)
 
             embed = discord.Embed(
                 title="Playlist Created",
@@ -971,21 +1349,60 @@ class Music(commands.Cog):
             self.logger.error("Unable to create playlist", exc_info=e)
             await interaction.followup.send("Unable to create playlist", ephemeral=True)
 
+    async def _resolve_playlist(
+        self, name: str, owner_id: int, refresh: bool = False
+    ) -> Optional[dict]:
+        """Retrieves a playlist by name and owner_id, from the cache unless refresh is set."""
+        key = (owner_id, name)
+        if not refresh:
+            cached = self._playlist_cache.get(key)
+            if cached is not None:
+                return cached
+
+        # The commands only ever read these columns of a playlist
+        playlist = await self.database.playlist.get_by_name_owner_id(
+            name, owner_id, columns="playlist_id, owner_id, name"
+        )
+        if playlist:
+            self._playlist_cache.set(key, playlist)
+        else:
+            self._playlist_cache.pop(key)
+        return playlist
+
+    async def _require_playlist(
+        self, interaction: discord.Interaction, name: str, owner_id: int
+    ) -> Optional[dict]:
+        """Resolves a playlist, or tells the user it was not found and returns None."""
+        playlist = await self._resolve_playlist(name, owner_id)
+        if not playlist:
+            await interaction.followup.send(f"Playlist '{name}' not found", ephemeral=True)
+        return playlist
+
+    def _invalidate_playlist(self, name: str, owner_id: int) -> None:
+        """Drops a cached playlist and its owner's names after it was renamed or deleted."""
+        self._playlist_cache.pop((owner_id, name))
+        self._playlist_names_cache.pop(owner_id)
+
+    async def _list_playlist_names(self, owner_id: int) -> List[str]:
+        """Lists the playlist names of an owner, cached briefly for autocomplete."""
+        names: Optional[List[str]] = self._playlist_names_cache.get(owner_id)
+        if names is None:
+            names = await self.database.playlist.list_names_by_owner(owner_id)
+            self._playlist_names_cache.set(owner_id, names)
+        return names
+
     async def _autocomplete_playlist(
         self, interaction: discord.Interaction, playlist_name: str, owner_id: int
     ) -> List[app_commands.Choice[str]]:
         """Return a list of playlist names."""
         try:
+            names = await self._list_playlist_names(owner_id)
 
-            playlists = await self.database.playlist.list_by_owner(owner_id)
-
+            # Filter before limiting, names past the first 25 can still match
+            matches = (name for name in names if name.startswith(playlist_name))
             return [
-                app_commands.Choice(
-                    name=playlist.get("name", "Unknown"),
-                    value=playlist.get("name", "Unknown"),
-                )
-                for playlist in playlists[:25]
-                if str(playlist.get("name", "Unknown")).startswith(playlist_name)
+                app_commands.Choice(name=name, value=name)
+                for name in itertools.islice(matches, 25)
             ]
         except Exception as e:
             self.logger.error("Unable to autocomplete playlist", exc_info=e)
@@ -1000,21 +1417,30 @@ class Music(commands.Cog):
     ):
         await interaction.response.defer(ephemeral=True)
 
+        if playlist_name == new_name:
+            await interaction.followup.send(
+                f"Playlist is already named '{new_name}'", ephemeral=True
+            )
+            return
+
         try:
-            playlist: dict = await self.database.playlist.get_by_name_owner_id(
-                playlist_name, interaction.user.id
+            renamed = await self.database.playlist.rename(
+                playlist_name, interaction.user.id, new_name
             )
 
-            if not playlist:
-                await interaction.followup.send(
-                    f"Playlist '{playlist_name}' not found", ephemeral=True
-                )
-                return
+            if not renamed:
+                # No row updated, look the playlist up only to explain why
+                if await self._resolve_playlist(
+                    playlist_name, interaction.user.id, refresh=True
+                ):
+                    message = f"Playlist '{new_name}' already exists"
+                else:
+                    message = f"Playlist '{playlist_name}' not found"
 
-            await self.database.playlist.update(
-                playlist.get("playlist_id"), name=new_name
-            )
+                await interaction.followup.send(message, ephemeral=True)
+                return
 
+            self._invalidate_playlist(playlist_name, interaction.user.id)
             await interaction.followup.send(
                 f"Playlist '{playlist_name}' renamed to '{new_name}'", ephemeral=True
             )
@@ -1038,18 +1464,15 @@ class Music(commands.Cog):
         await interaction.response.defer(ephemeral=True)
 
         try:
-            playlist: dict = await self.database.playlist.get_by_name_owner_id(
-                playlist_name, interaction.user.id
+            playlist: dict = await self._require_playlist(
+                interaction, playlist_name, interaction.user.id
             )
-
             if not playlist:
-                await interaction.followup.send(
-                    f"Playlist '{playlist_name}' not found", ephemeral=True
-                )
                 return
 
             await self.database.track.delete_by_playlist_id(playlist.get("playlist_id"))
             await self.database.playlist.delete(playlist.get("playlist_id"))
+            self._invalidate_playlist(playlist_name, interaction.user.id)
 
             await interaction.followup.send(
                 f"Deleted playlist '{playlist_name}', use '/playlist list' to see all your playlists ",
@@ -1082,20 +1505,26 @@ class Music(commands.Cog):
 
         try:
             user_id = member.id if member else interaction.user.id
-            playlist: dict = await self.database.playlist.get_by_name_owner_id(
-                playlist_name, user_id
+            playlist: dict = await self._require_playlist(
+                interaction, playlist_name, user_id
             )
-
             if not playlist:
-                await interaction.followup.send(
-                    f"Playlist '{playlist_name}' not found", ephemeral=True
-                )
                 return
 
-            tracks = await self.database.track.list_by_playlist(
-                playlist.get("playlist_id")
+            playlist_id = playlist.get("playlist_id")
+            track_count, first_page = await asyncio.gather(
+                self.database.track.count_by_playlist(playlist_id),
+                self.database.track.list_page_by_playlist(
+                    playlist_id, 10, columns="title, url"
+                ),
+            )
+            view = PlaylistTrackView(
+                self.database,
+                playlist_id,
+                playlist.get("name"),
+                track_count,
+                first_page,
             )
-            view = PlaylistTrackView(tracks, playlist.get("name"))
             await interaction.followup.send(embed=view.create_embed(), view=view)
         except Exception as e:
             await interaction.followup.send(
@@ -1127,14 +1556,10 @@ class Music(commands.Cog):
         await interaction.response.defer()
 
         try:
-            playlist: dict = await self.database.playlist.get_by_name_owner_id(
-                playlist_name, interaction.user.id
+            playlist: dict = await self._require_playlist(
+                interaction, playlist_name, interaction.user.id
             )
-
             if not playlist:
-                await interaction.followup.send(
-                    f"Playlist '{playlist_name}' not found", ephemeral=True
-                )
                 return
 
             # get all tracks in the playlist
@@ -1148,24 +1573,13 @@ class Music(commands.Cog):
                 )
                 return
 
-            tracks_obj = {
-                "playlist_name": playlist.get("name"),
-                "playlist_owner": playlist.get("owner_id"),
-                "songs": [
-                    {
-                        "title": track.get("title"),
-                        "url": track.get("url"),
-                    }
-                    for track in tracks
-                ],
-            }
-
             # export playlist
-            json_data = json.dumps(tracks_obj)
-            compressed_data = zlib.compress(json_data.encode("utf-8"))
-            # f = Fernet(FERNET_KEY)
-            # encrypted_data = f.encrypt(compressed_data)
-            encoded_data = base64.urlsafe_b64encode(compressed_data)
+            if len(tracks) > _OFFLOAD_ENCODE_THRESHOLD:
+                encoded_data = await asyncio.to_thread(
+                    self._encode_playlist_export, playlist, tracks
+                )
+            else:
+                encoded_data = self._encode_playlist_export(playlist, tracks)
             base64_data = encoded_data.decode("utf-8")
 
             # send base64 string if less than 2000 characters
@@ -1188,6 +1602,36 @@ class Music(commands.Cog):
             )
             return
 
+    @staticmethod
+    def _encode_playlist_export(playlist: dict, tracks: List[dict]) -> bytes:
+        """Serializes, compresses and base64 encodes an exported playlist.
+
+        The JSON is fed to the compressor one song at a time, so the whole
+        document is never held in memory next to its compressed form.
+        """
+        compressor = zlib.compressobj()
+        header = json.dumps(
+            {
+                "playlist_name": playlist.get("name"),
+                "playlist_owner": playlist.get("owner_id"),
+            },
+            separators=(",", ":"),
+        )
+        chunks = [compressor.compress(f'{header[:-1]},"songs":['.encode("utf-8"))]
+        for index, track in enumerate(tracks):
+            song = json.dumps(
+                {"title": track.get("title"), "url": track.get("url")},
+                separators=(",", ":"),
+            )
+            if index:
+                song = "," + song
+            chunks.append(compressor.compress(song.encode("utf-8")))
+        chunks.append(compressor.compress(b"]}"))
+        chunks.append(compressor.flush())
+        # f = Fernet(FERNET_KEY)
+        # encrypted_data = f.encrypt(compressed_data)
+        return base64.urlsafe_b64encode(b"".join(chunks))
+
     @playlist_export.autocomplete("playlist_name")
     async def autocomplete_playlist_export(
         self, interaction: discord.Interaction, playlist_name: str
@@ -1218,18 +1662,18 @@ class Music(commands.Cog):
         await interaction.response.defer(ephemeral=True)
 
         try:
-            player: Optional[wavelink.Player] = await self._get_player(interaction)
+            user_id = member.id if member else interaction.user.id
+            # The voice connect and both lookups are independent of each other
+            player, (volume, autoplay_mode), playlist = await asyncio.gather(
+                self._get_player(interaction),
+                self._get_user_settings(interaction.user.id),
+                self._resolve_playlist(playlist_name, user_id),
+            )
             if not player:
                 return
 
-            volume, autoplay_mode = await self._get_user_settings(interaction.user.id)
             player.autoplay = autoplay_mode
 
-            user_id = member.id if member else interaction.user.id
-            playlist = await self.database.playlist.get_by_name_owner_id(
-                playlist_name, user_id
-            )
-
             if not playlist:
                 await interaction.followup.send(
                     f"Playlist '{playlist_name}' not found", ephemeral=True
@@ -1237,7 +1681,7 @@ class Music(commands.Cog):
                 return
 
             songs = await self.database.track.list_by_playlist(
-                playlist.get("playlist_id")
+                playlist.get("playlist_id"), shuffled=shuffled
             )
 
             if not songs:
@@ -1248,34 +1692,56 @@ class Music(commands.Cog):
                 )
                 return
 
-            if shuffled:
-                random.shuffle(songs)
+            embed = discord.Embed(
+                title=f"Playing Playlist: {playlist_name}",
+                description=f"Loading {len(songs)} songs…",
+                color=discord.Color.green(),
+            )
+            embed.set_footer(text=f"Requested by {interaction.user}")
+
+            # Acknowledge right away, the tracks are resolved while it is sent
+            ack = asyncio.create_task(
+                interaction.followup.send(embed=embed, ephemeral=True, wait=True)
+            )
+
+            # Search concurrently, gather keeps the results in playlist order
+            semaphore = asyncio.Semaphore(self._PLAYLIST_SEARCH_CONCURRENCY)
 
-            for song in songs:
-                tracks: Optional[wavelink.Search] = await self._search_tracks(
-                    song.get("url")
-                )
-                if not tracks:
-                    await self._send_error_as_embed(
-                        interaction,
-                        f"No tracks found for query: `{song.get("title")}`.",
-                        True,
+            async def resolve(url: str) -> Optional[wavelink.Playable]:
+                async with semaphore:
+                    return await self._resolve_track(url)
+
+            results = await asyncio.gather(
+                *(resolve(song.get("url")) for song in songs), return_exceptions=True
+            )
+            playables: List[wavelink.Playable] = [
+                track for track in results if isinstance(track, wavelink.Playable)
+            ]
+            message = await ack
+
+            if not playables:
+                # Replace the loading notice instead of leaving it next to the error
+                await message.edit(
+                    embed=self._template_embed(
+                        self._ERROR_EMBED_BASE,
+                        f"No tracks of playlist '{playlist_name}' could be found.",
                     )
-                    return
+                )
+                return
 
-                await player.queue.put_wait(tracks[0])
+            await player.queue.put_wait(playables)
 
             if not player.playing:
                 await player.play(player.queue.get(), volume=volume)
 
-            embed = discord.Embed(
-                title=f"Playing Playlist: {playlist_name}",
-                description=f"Playing {len(songs)} songs",
-                color=discord.Color.green(),
-            )
-            embed.set_footer(text=f"Requested by {interaction.user}")
-
-            await interaction.followup.send(embed=embed, ephemeral=True)
+            # Replace the loading notice with what was actually queued
+            embed.description = f"Playing {len(playables)} songs"
+            skipped = len(songs) - len(playables)
+            if skipped:
+                embed.description += (
+                    f"\nSkipped {skipped} songs that could not be found."
+                )
+            await message.edit(embed=embed)
 
         except Exception as e:
             await interaction.followup.send(
@@ -1299,40 +1765,29 @@ class Music(commands.Cog):
         description="Inserts the current queue into a playlist. (Will replace existing playlist)",
     )
     async def song_current(self, interaction: discord.Interaction, playlist_name: str):
-        await interaction.response.defer()
-
-        player: wavelink.Player = interaction.guild.voice_client
+        await interaction.response.defer(ephemeral=True)
 
+        player: Optional[wavelink.Player] = await self._require_player(interaction)
         if not player:
-            await interaction.followup.send(
-                "There is no music playing or player not connected", ephemeral=True
-            )
             return
 
         try:
-            playlist = await self.database.playlist.get_by_name_owner_id(
-                playlist_name, interaction.user.id
+            playlist = await self._require_playlist(
+                interaction, playlist_name, interaction.user.id
             )
-
             if not playlist:
-                await interaction.followup.send(
-                    f"Playlist '{playlist_name}' not found", ephemeral=True
-                )
                 return
 
-            await self.database.track.delete_by_playlist_id(playlist.get("playlist_id"))
-
+            # Snapshot the queue so tracks added meanwhile can't shift the rows
+            snapshot = list(player.queue)
             if player.playing:
-                track = player.current
+                snapshot.insert(0, player.current)
 
-                await self.database.track.create(
-                    playlist.get("playlist_id"), track.title, track.uri
-                )
+            tracks = [{"title": track.title, "url": track.uri} for track in snapshot]
 
-            for i, track_ in enumerate(player.queue):
-                await self.database.track.create(
-                    playlist.get("playlist_id"), track_.title, track_.uri
-                )
+            await self.database.track.replace_by_playlist_id(
+                playlist.get("playlist_id"), tracks
+            )
 
             await interaction.followup.send(
                 f"Current queue inserted into playlist '{playlist_name}'",
@@ -1365,17 +1820,14 @@ class Music(commands.Cog):
         await interaction.response.defer(ephemeral=True)
 
         try:
-            playlist = await self.database.playlist.get_by_name_owner_id(
-                playlist_name, interaction.user.id
-            )
-
-            if not playlist:
+            # The cached lookup is cheap, a missing playlist must not cost a search
+            if not await self._resolve_playlist(playlist_name, interaction.user.id):
                 await self._send_error_as_embed(
                     interaction, f"Playlist '{playlist_name}' not found.", True
                 )
                 return
 
-            song_tracks = await wavelink.Playable.search(song_query)
+            song_tracks = await self._search_tracks(song_query)
 
             if not song_tracks:
                 await self._send_error_as_embed(
@@ -1383,21 +1835,25 @@ class Music(commands.Cog):
                 )
                 return
 
-            track_title: str = ""
-
             if isinstance(song_tracks, wavelink.Playlist):
-                for track in song_tracks:
-                    await self.database.track.create(
-                        playlist.get("playlist_id"), track.title, track.uri
-                    )
-                track_title = song_tracks[0].title
+                tracks = song_tracks.tracks
             else:
-                await self.database.track.create(
-                    playlist.get("playlist_id"),
-                    song_tracks[0].title,
-                    song_tracks[0].uri,
+                tracks = song_tracks[:1]
+            track_title: str = tracks[0].title
+
+            # Resolves the playlist again in the insert, nothing is inserted when
+            # it was deleted since the lookup above
+            created = await self.database.track.create_many_by_playlist_name(
+                playlist_name,
+                interaction.user.id,
+                [{"title": track.title, "url": track.uri} for track in tracks],
+            )
+
+            if not created:
+                await self._send_error_as_embed(
+                    interaction, f"Playlist '{playlist_name}' not found.", True
                 )
-                track_title = song_tracks[0].title
+                return
 
             await self._send_success_playlist_embed(
                 interaction, playlist_name, track_title, True
@@ -1422,19 +1878,38 @@ class Music(commands.Cog):
     ) -> List[app_commands.Choice[str]]:
         return await self._autocomplete_query(interaction, song_query)
 
+    @playlist_song.command(
+        name="add_many",
+        description="Adds several songs to a playlist, one title or url per line",
+    )
+    async def song_add_many(self, interaction: discord.Interaction, playlist_name: str):
+        # Checked before the modal opens, so nobody types a list for a missing playlist
+        if not await self._resolve_playlist(playlist_name, interaction.user.id):
+            await interaction.response.send_message(
+                f"Playlist '{playlist_name}' not found", ephemeral=True
+            )
+            return
+
+        modal = AddSongsModal(self.database, playlist_name, self._search_tracks)
+        await interaction.response.send_modal(modal)
+
+    @song_add_many.autocomplete("playlist_name")
+    async def song_add_many_autocomplete(
+        self, interaction: discord.Interaction, playlist_name: str
+    ) -> List[app_commands.Choice[str]]:
+        return await self._autocomplete_playlist(
+            interaction, playlist_name, interaction.user.id
+        )
+
     @playlist_song.command(name="remove", description="Removes a song from a playlist.")
     async def song_remove(self, interaction: discord.Interaction, playlist_name: str):
         await interaction.response.defer(ephemeral=True)
 
         try:
-            playlist = await self.database.playlist.get_by_name_owner_id(
-                playlist_name, interaction.user.id
+            playlist = await self._require_playlist(
+                interaction, playlist_name, interaction.user.id
             )
-
             if not playlist:
-                await interaction.followup.send(
-                    f"Playlist '{playlist_name}' not found", ephemeral=True
-                )
                 return
 
             tracks = await self.database.track.list_by_playlist(
@@ -1478,14 +1953,10 @@ class Music(commands.Cog):
         await interaction.response.defer(ephemeral=True)
 
         try:
-            playlist = await self.database.playlist.get_by_name_owner_id(
-                playlist_name, interaction.user.id
+            playlist = await self._require_playlist(
+                interaction, playlist_name, interaction.user.id
             )
-
             if not playlist:
-                await interaction.followup.send(
-                    f"Playlist '{playlist_name}' not found", ephemeral=True
-                )
                 return
 
             await self.database.track.delete_by_playlist_id(playlist.get("playlist_id"))
@@ -1503,7 +1974,9 @@ class Music(commands.Cog):
     async def song_clear_autocomplete(
         self, interaction: discord.Interaction, playlist_name: str
     ) -> List[app_commands.Choice[str]]:
-        return await self._autocomplete_playlist(interaction, playlist_name)
+        return await self._autocomplete_playlist(
+            interaction, playlist_name, interaction.user.id
+        )
 
     async def cog_app_command_error(
         self,
@@ -1,19 +1,100 @@
+import os
+import re
 import duckdb
 import asyncio
-from typing import List, Dict, Any, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import List, Dict, Any, Optional, Iterator
 from entities.guild import *
 from entities.member import *
 from entities.playlist import *
 from entities.track import *
 
+_READ_QUERY_RE = re.compile(r"\s*(?:SELECT|WITH)\b", re.IGNORECASE)
+# Maximum number of rows per multi-row INSERT statement
+INSERT_BATCH_SIZE = 1000
+
 
 class DatabaseManager:
-    def __init__(self, database_path: str = ":memory:"):
+    def __init__(
+        self, database_path: str = ":memory:", pool_size: Optional[int] = None
+    ):
         self.database_path = database_path
+        # One read cursor per pool thread, sized to the cores but never below two
+        # so a pending write can't hold up every read
+        self.pool_size = pool_size or max(2, min(os.cpu_count() or 1, 4))
         self._guild_manager = None
         self._member_manager = None
         self._playlist_manager = None
         self._track_manager = None
+        self._connection: Optional[duckdb.DuckDBPyConnection] = None
+        self._lock = threading.Lock()
+        self._readers = threading.local()
+        self._reader_cursors: List[duckdb.DuckDBPyConnection] = []
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # The bot never drops tables, so a table once seen keeps existing
+        self._known_tables: set[str] = set()
+
+    def _get_connection(self) -> duckdb.DuckDBPyConnection:
+        """Returns the shared database connection, opening it on first use."""
+        if self._connection is None:
+            self._connection = duckdb.connect(self.database_path)
+        return self._connection
+
+    def _get_reader(self) -> duckdb.DuckDBPyConnection:
+        """Returns the read cursor of the current worker thread, creating it on first use.
+
+        Calls may land on any cursor, so connection-scoped state such as temporary
+        tables or prepared statements must not be relied upon across calls.
+        """
+        reader = getattr(self._readers, "cursor", None)
+        if reader is None:
+            with self._lock:
+                reader = self._get_connection().cursor()
+                self._reader_cursors.append(reader)
+            self._readers.cursor = reader
+        return reader
+
+    async def _run(self, func, *args) -> Any:
+        """Runs a blocking database call on the database worker pool.
+
+        The pool bounds the number of read cursors and keeps database calls
+        from queueing behind other work on the default executor.
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.pool_size, thread_name_prefix="database"
+            )
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, func, *args
+        )
+
+    @contextmanager
+    def _connection_for(self, query: str) -> Iterator[duckdb.DuckDBPyConnection]:
+        """Yields a per-thread read cursor for SELECT queries, otherwise the locked write connection."""
+        if _READ_QUERY_RE.match(query):
+            yield self._get_reader()
+            return
+
+        with self._lock:
+            yield self._get_connection()
+
+    def close(self) -> None:
+        """Closes the worker pool, the read cursors and the shared database connection."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+        with self._lock:
+            for reader in self._reader_cursors:
+                reader.close()
+            self._reader_cursors.clear()
+            self._readers = threading.local()
+
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
 
     async def query(self, query: str, params: Optional[tuple] = None) -> List[Any]:
         """
@@ -27,7 +108,7 @@ class DatabaseManager:
             A list of results from the query execution.
 
         """
-        return await asyncio.to_thread(self._execute_query, query, params)
+        return await self._run(self._execute_query, query, params)
 
     def _execute_query(self, query: str, params: Optional[tuple] = None) -> List[Any]:
         """Execute a SQL query against the database, and return the results.
@@ -41,38 +122,122 @@ class DatabaseManager:
 
         """
 
-        with duckdb.connect(self.database_path) as conn:
+        with self._connection_for(query) as conn:
             return conn.execute(query, params or ()).fetchall() or []
 
-    async def create_table(self, table_name: str, schema: str):
-        """Creates a table."""
-        await self.query(f"CREATE TABLE IF NOT EXISTS {table_name} ({schema})")
+    async def query_dicts(
+        self, query: str, params: Optional[tuple] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Asynchronously execute a SQL query and return its rows keyed by column name.
+
+        Args:
+            query: The SQL query to execute.
+            params: Optional parameters to pass to the query.
+
+        Returns:
+            A list of dictionaries, one per row.
+
+        """
+        return await self._run(self._execute_query_dicts, query, params)
 
-    async def insert(self, table_name: str, data: List[Dict], mode: str = "normal"):
-        """Inserts data into a table with optional IGNORE/REPLACE modes.
+    def _execute_query_dicts(
+        self, query: str, params: Optional[tuple] = None
+    ) -> List[Dict[str, Any]]:
+        """Execute a SQL query and map each row to the column names of the result.
 
         Args:
-            table_name: Name of the target table
-            data: List of dictionaries containing row data
-            mode: 'normal', 'ignore', or 'replace'
+            query: The SQL query to execute.
+            params: Optional parameters to pass to the query.
+
+        Returns:
+            A list of dictionaries, or an empty list if no results.
+
         """
-        if not data:
+
+        with self._connection_for(query) as conn:
+            cursor = conn.execute(query, params or ())
+            if cursor.description is None:
+                return []
+            columns = [column[0] for column in cursor.description]
+            return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+    async def query_many(self, query: str, params_list: List[tuple]) -> None:
+        """
+        Asynchronously execute a SQL statement once for every parameter tuple.
+
+        Args:
+            query: The SQL statement to execute.
+            params_list: A list of parameter tuples, one per execution.
+
+        """
+        if not params_list:
             return
+        await self._run(self._execute_many, query, params_list)
+
+    def _execute_many(self, query: str, params_list: List[tuple]) -> None:
+        """Execute a SQL statement for every parameter tuple in a single transaction.
+
+        Args:
+            query: The SQL statement to execute.
+            params_list: A list of parameter tuples, one per execution.
+
+        """
+
+        with self._lock:
+            conn = self._get_connection()
+            conn.begin()
+            try:
+                conn.executemany(query, params_list)
+            except Exception:
+                conn.rollback()
+                raise
+            conn.commit()
+
+    async def transaction(self, statements: List[tuple[str, tuple]]) -> List[List[Any]]:
+        """
+        Asynchronously execute several SQL statements in a single transaction.
 
-        columns = ", ".join(data[0].keys())
-        placeholders = ", ".join(["?"] * len(data[0]))
+        Args:
+            statements: A list of (query, params) tuples, executed in order.
 
-        insert_type = {
-            "normal": "INSERT",
-            "ignore": "INSERT OR IGNORE",
-            "replace": "INSERT OR REPLACE",
-        }.get(mode.lower(), "INSERT")
+        Returns:
+            The results of every statement, in the same order.
 
-        query = f"{insert_type} INTO {table_name} ({columns}) VALUES ({placeholders})"
+        """
+        return await self._run(self._execute_transaction, statements)
 
-        for row in data:
-            values = tuple(row.values())
-            await self.query(query, values)
+    def _execute_transaction(
+        self, statements: List[tuple[str, tuple]]
+    ) -> List[List[Any]]:
+        """Execute SQL statements on the write connection, rolling back all of them if one fails.
+
+        Args:
+            statements: A list of (query, params) tuples, executed in order.
+
+        Returns:
+            The results of every statement, in the same order.
+
+        """
+
+        with self._lock:
+            conn = self._get_connection()
+            conn.begin()
+            try:
+                results = [
+                    conn.execute(query, params or ()).fetchall() or []
+                    for query, params in statements
+                ]
+            except Exception:
+                conn.rollback()
+                raise
+            conn.commit()
+            return results
+
+    async def create_table(self, table_name: str, schema: str):
+        """Creates a table."""
+        await self.query(f"CREATE TABLE IF NOT EXISTS {table_name} ({schema})")
+        self._known_tables.add(table_name)
 
     async def insert(
         self,
@@ -123,9 +288,27 @@ class DatabaseManager:
 
             query = f"{insert_type} INTO {table_name} ({columns_str}) VALUES ({placeholders})"
 
-        for row in data:
-            values = tuple(row.values())
-            await self.query(query, values)
+            # Plain and ignoring inserts keep their result when all rows go
+            # in one multi-row statement, which DuckDB parses and plans once
+            if insert_type != "INSERT OR REPLACE":
+                await self.transaction(
+                    [
+                        (
+                            f"{insert_type} INTO {table_name} ({columns_str}) VALUES "
+                            + ", ".join([f"({placeholders})"] * len(batch)),
+                            tuple(value for row in batch for value in row.values()),
+                        )
+                        for batch in (
+                            data[start : start + INSERT_BATCH_SIZE]
+                            for start in range(0, len(data), INSERT_BATCH_SIZE)
+                        )
+                    ]
+                )
+                return
+
+        # Replacing and upserting rows run one by one, so a key repeated within
+        # data is resolved by its last row
+        await self.query_many(query, [tuple(row.values()) for row in data])
 
     async def update(
         self,
@@ -133,12 +316,13 @@ class DatabaseManager:
         data: Dict,
         where_clause: str,
         where_params: Optional[tuple] = None,
-    ):
-        """Updates data in a table."""
+    ) -> int:
+        """Updates data in a table, returns the number of updated rows."""
         set_clause = ", ".join([f"{key} = ?" for key in data])
         query = f"UPDATE {table_name} SET {set_clause} WHERE {where_clause}"
         values = tuple(data.values()) + (where_params or ())
-        await self.query(query, values)
+        result = await self.query(query, values)
+        return result[0][0] if result else 0
 
     async def delete(
         self, table_name: str, where_clause: str, where_params: Optional[tuple] = None
@@ -165,9 +349,14 @@ class DatabaseManager:
         return results[0] if results else None
 
     async def table_exists(self, table_name: str) -> bool:
-        """Checks if a table exists."""
+        """Checks if a table exists, answering from memory once it was found."""
+        if table_name in self._known_tables:
+            return True
+
         query = "SELECT name FROM sqlite_master WHERE type='table' AND name = ?"  # Use sqlite_master for DuckDB
         result = await self.query(query, (table_name,))
+        if result:
+            self._known_tables.add(table_name)
         return bool(result)
 
     @property
@@ -0,0 +1,9 @@
+from functools import lru_cache
+from typing import Tuple
+
+
+@lru_cache(maxsize=128)
+def update_query(table: str, columns: Tuple[str, ...], key_column: str) -> str:
+    """Builds an UPDATE statement for the given columns, cached per column combination."""
+    set_clause = ", ".join(f"{column} = ?" for column in columns)
+    return f"UPDATE {table} SET {set_clause} WHERE {key_column} = ?"
@@ -1,5 +1,6 @@
 import duckdb
 from typing import Optional, List, Dict, Any
+from entities.base import update_query
 
 
 class Guild:
@@ -42,17 +43,22 @@ class Guild:
             ),
         )
 
+    async def create_many_or_ignore(self, guild_ids: List[int]) -> None:
+        """Create guild records with default settings in a single batch, ignoring existing ones."""
+        await self.db_manager.query_many(
+            "INSERT OR IGNORE INTO guild (guild_id) VALUES (?)",
+            [(guild_id,) for guild_id in guild_ids],
+        )
+
     async def get(self, guild_id: int) -> Optional[Dict[str, Any]]:
         """Retrieves a guild record by guild_id."""
 
-        results = await self.db_manager.query(
+        results = await self.db_manager.query_dicts(
             "SELECT * FROM guild WHERE guild_id = ?", (guild_id,)
         )
 
         if results:
-            result = results[0]
-            columns = ["guild_id", "twenty_four_online", "music_channel_id"]
-            return dict(zip(columns, result))
+            return results[0]
 
         return None
 
@@ -64,22 +70,18 @@ class Guild:
     ) -> None:
         """Updates a guild record by guild_id."""
 
-        update_pairs = []
-        params = []
-
-        if twenty_four_online is not None:
-            update_pairs.append("twenty_four_online = ?")
-            params.append(twenty_four_online)
-
-        if music_channel_id is not None:
-            update_pairs.append("music_channel_id = ?")
-            params.append(music_channel_id)
+        updates = {
+            column: value
+            for column, value in (
+                ("twenty_four_online", twenty_four_online),
+                ("music_channel_id", music_channel_id),
+            )
+            if value is not None
+        }
 
-        if update_pairs:
-            params.append(guild_id)
-            set_clause = ", ".join(update_pairs)
-            sql = f"UPDATE guild SET {set_clause} WHERE guild_id = ?"
-            await self.db_manager.query(sql, tuple(params))
+        if updates:
+            sql = update_query("guild", tuple(updates), "guild_id")
+            await self.db_manager.query(sql, (*updates.values(), guild_id))
 
     async def delete(self, guild_id: int) -> None:
         """Deletes a guild record by guild_id."""
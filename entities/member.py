@@ -1,5 +1,6 @@
 import duckdb
 from typing import Optional, List, Dict, Any
+from entities.base import update_query
 
 
 class Member:
@@ -38,15 +39,47 @@ class Member:
             (user_id, volume, filters, autoplay, loop),
         )
 
+    async def create_or_ignore(
+        self,
+        user_id: int,
+        volume: int = 30,
+        filters: Optional[str] = None,
+        autoplay: str = "partial",
+        loop: str = "normal",
+    ) -> None:
+        """Creates a new member record, ignoring if it already exists."""
+        await self.db_manager.query(
+            "INSERT OR IGNORE INTO member (user_id, volume, filters, autoplay, loop) VALUES (?, ?, ?, ?, ?)",
+            (user_id, volume, filters, autoplay, loop),
+        )
+
+    async def get_or_create(
+        self,
+        user_id: int,
+        volume: int = 30,
+        filters: Optional[str] = None,
+        autoplay: str = "partial",
+        loop: str = "normal",
+    ) -> Optional[Dict[str, Any]]:
+        """Retrieves a member record by user_id, creating it with the given values if missing."""
+        # The no-op DO UPDATE makes RETURNING yield the existing row as well,
+        # so both cases take a single round trip
+        results = await self.db_manager.query_dicts(
+            "INSERT INTO member (user_id, volume, filters, autoplay, loop) VALUES (?, ?, ?, ?, ?) "
+            "ON CONFLICT (user_id) DO UPDATE SET volume = member.volume RETURNING *",
+            (user_id, volume, filters, autoplay, loop),
+        )
+        if results:
+            return results[0]
+        return None
+
     async def get(self, user_id: int) -> Optional[Dict[str, Any]]:
         """Retrieves a member record by user_id."""
-        results = await self.db_manager.query(
+        results = await self.db_manager.query_dicts(
             "SELECT * FROM member WHERE user_id = ?", (user_id,)
         )
         if results:
-            result = results[0]
-            columns = ["user_id", "volume", "filters", "autoplay", "loop"]
-            return dict(zip(columns, result))
+            return results[0]
         return
 
     async def update(
@@ -58,26 +91,58 @@ class Member:
         loop: Optional[str] = None,
     ) -> None:
         """Updates a member record by user_id."""
-        update_pairs = []
-        params = []
-        if volume is not None:
-            update_pairs.append("volume = ?")
-            params.append(volume)
-        if filters is not None:
-            update_pairs.append("filters = ?")
-            params.append(filters)
-        if autoplay is not None:
-            update_pairs.append("autoplay = ?")
-            params.append(autoplay)
-        if loop is not None:
-            update_pairs.append("loop = ?")
-            params.append(loop)
-
-        if update_pairs:
-            params.append(user_id)
-            set_clause = ", ".join(update_pairs)
-            sql = f"UPDATE member SET {set_clause} WHERE user_id = ?"
-            await self.db_manager.query(sql, tuple(params))
+        updates = {
+            column: value
+            for column, value in (
+                ("volume", volume),
+                ("filters", filters),
+                ("autoplay", autoplay),
+                ("loop", loop),
+            )
+            if value is not None
+        }
+
+        if updates:
+            sql = update_query("member", tuple(updates), "user_id")
+            await self.db_manager.query(sql, (*updates.values(), user_id))
+
+    async def upsert(
+        self,
+        user_id: int,
+        volume: Optional[int] = None,
+        filters: Optional[str] = None,
+        autoplay: Optional[str] = None,
+        loop: Optional[str] = None,
+    ) -> None:
+        """Creates a member record with defaults or updates the given fields of an existing one."""
+        updates = {
+            column: value
+            for column, value in (
+                ("volume", volume),
+                ("filters", filters),
+                ("autoplay", autoplay),
+                ("loop", loop),
+            )
+            if value is not None
+        }
+        if not updates:
+            return
+
+        set_clause = ", ".join(f"{column} = excluded.{column}" for column in updates)
+        sql = (
+            "INSERT INTO member (user_id, volume, filters, autoplay, loop) VALUES (?, ?, ?, ?, ?) "
+            f"ON CONFLICT (user_id) DO UPDATE SET {set_clause}"
+        )
+        await self.db_manager.query(
+            sql,
+            (
+                user_id,
+                30 if volume is None else volume,
+                filters,
+                autoplay or "partial",
+                loop or "normal",
+            ),
+        )
 
     async def delete(self, user_id: int) -> None:
         """Deletes a member record by user_id."""
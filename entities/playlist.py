@@ -1,6 +1,7 @@
 import duckdb
 import uuid
 from typing import Optional, List, Dict, Any
+from entities.base import update_query
 
 
 class Playlist:
@@ -29,45 +30,62 @@ class Playlist:
         )
         return playlist_id
 
+    async def create_with_tracks(
+        self,
+        owner_id: int,
+        name: str,
+        tracks: List[Dict[str, Any]],
+        playlist_id: Optional[uuid.UUID] = None,
+    ) -> uuid.UUID:
+        """Creates a playlist record and its track records in a single transaction, returns the playlist_id."""
+        if playlist_id is None:
+            playlist_id = uuid.uuid4()
+
+        statements = [
+            (
+                "INSERT INTO playlist (playlist_id, owner_id, name) VALUES (?, ?, ?)",
+                (playlist_id, owner_id, name),
+            )
+        ]
+        if tracks:
+            values = ", ".join(["(?, ?, ?)"] * len(tracks))
+            params = [
+                value
+                for track in tracks
+                for value in (playlist_id, track.get("title"), track.get("url"))
+            ]
+            statements.append(
+                (
+                    f"INSERT INTO track (playlist_id, title, url) VALUES {values}",
+                    tuple(params),
+                )
+            )
+
+        await self.db_manager.transaction(statements)
+        return playlist_id
+
     async def get(self, playlist_id: uuid.UUID) -> Optional[Dict[str, Any]]:
         """Retrieves a playlist record by playlist_id."""
-        results = await self.db_manager.query(
+        results = await self.db_manager.query_dicts(
             "SELECT * FROM playlist WHERE playlist_id = ?", (playlist_id,)
         )
         if results:
-            result = results[0]
-            columns = [
-                "playlist_id",
-                "owner_id",
-                "name",
-                "description",
-                "public",
-                "locked",
-            ]
-            return dict(zip(columns, result))
+            return results[0]
         return None
 
     async def get_by_name_owner_id(
         self,
         name: str,
         owner_id: int,
+        columns: str = "*",
     ) -> Optional[Dict[str, Any]]:
-        """Retrieves a playlist record by name and owner_id."""
-        results = await self.db_manager.query(
-            "SELECT * FROM playlist WHERE name = ? AND owner_id = ?",
+        """Retrieves a playlist record by name and owner_id, limited to the given columns."""
+        results = await self.db_manager.query_dicts(
+            f"SELECT {columns} FROM playlist WHERE name = ? AND owner_id = ?",
             (name, owner_id),
         )
         if results:
-            result = results[0]
-            columns = [
-                "playlist_id",
-                "owner_id",
-                "name",
-                "description",
-                "public",
-                "locked",
-            ]
-            return dict(zip(columns, result))
+            return results[0]
         return None
 
     async def list_by_name_owner_id(
@@ -76,14 +94,11 @@ class Playlist:
         owner_id: int,
     ) -> List[Dict[str, Any]]:
 
-        results = await self.db_manager.query(
+        return await self.db_manager.query_dicts(
             "SELECT * FROM playlist WHERE name = ? AND owner_id = ?",
             (name, owner_id),
         )
 
-        columns = ["playlist_id", "owner_id", "name", "description", "public", "locked"]
-        return [dict(zip(columns, row)) for row in results]
-
     async def update(
         self,
         playlist_id: uuid.UUID,
@@ -93,26 +108,37 @@ class Playlist:
         locked: Optional[bool] = None,
     ) -> None:
         """Updates a playlist record by playlist_id."""
-        update_pairs = []
-        params = []
-        if name is not None:
-            update_pairs.append("name = ?")
-            params.append(name)
-        if description is not None:
-            update_pairs.append("description = ?")
-            params.append(description)
-        if public is not None:
-            update_pairs.append("public = ?")
-            params.append(public)
-        if locked is not None:
-            update_pairs.append("locked = ?")
-            params.append(locked)
-
-        if update_pairs:
-            params.append(playlist_id)
-            set_clause = ", ".join(update_pairs)
-            sql = f"UPDATE playlist SET {set_clause} WHERE playlist_id = ?"
-            await self.db_manager.query(sql, tuple(params))
+        updates = {
+            column: value
+            for column, value in (
+                ("name", name),
+                ("description", description),
+                ("public", public),
+                ("locked", locked),
+            )
+            if value is not None
+        }
+
+        if updates:
+            sql = update_query("playlist", tuple(updates), "playlist_id")
+            await self.db_manager.query(sql, (*updates.values(), playlist_id))
+
+    async def rename(self, name: str, owner_id: int, new_name: str) -> bool:
+        """
+        Renames a playlist by name and owner_id, unless the owner already has a playlist named new_name.
+
+        Returns whether a row was updated, callers tell the two failure cases apart.
+        """
+        # No RETURNING, DuckDB runs UPDATE ... RETURNING as a delete plus insert
+        # which fails the foreign key of the playlist's tracks
+        updated = await self.db_manager.update(
+            "playlist",
+            {"name": new_name},
+            "name = ? AND owner_id = ? "
+            "AND NOT EXISTS (SELECT 1 FROM playlist WHERE owner_id = ? AND name = ?)",
+            (name, owner_id, owner_id, new_name),
+        )
+        return updated > 0
 
     async def delete(self, playlist_id: uuid.UUID) -> None:
         """Deletes a playlist record by playlist_id."""
@@ -122,11 +148,15 @@ class Playlist:
 
     async def list_by_owner(self, owner_id: int) -> List[Dict[str, Any]]:
         """Lists all playlists for a given owner_id."""
-        results = await self.db_manager.query(
+        return await self.db_manager.query_dicts(
             "SELECT * FROM playlist WHERE owner_id = ?", (owner_id,)
         )
-        playlists = []
-        columns = ["playlist_id", "owner_id", "name", "description", "public", "locked"]
-        for row in results:
-            playlists.append(dict(zip(columns, row)))
-        return playlists
+
+    async def list_names_by_owner(self, owner_id: int) -> List[str]:
+        """Lists the names of all playlists for a given owner_id, sorted by name."""
+        results = await self.db_manager.query(
+            "SELECT name FROM playlist WHERE owner_id = ? AND name IS NOT NULL "
+            "ORDER BY name",
+            (owner_id,),
+        )
+        return [row[0] for row in results]
@@ -1,6 +1,7 @@
 import duckdb
 import uuid
 from typing import Optional, List, Dict, Any
+from entities.base import update_query
 
 
 class Track:
@@ -28,15 +29,94 @@ class Track:
         )
         return track_id
 
+    async def create_many(
+        self, playlist_id: uuid.UUID, tracks: List[Dict[str, Any]]
+    ) -> None:
+        """Creates track records for a playlist in a single batch."""
+        await self.db_manager.query_many(
+            "INSERT INTO track (track_id, playlist_id, title, url, extra) VALUES (?, ?, ?, ?, ?)",
+            [
+                (
+                    uuid.uuid4(),
+                    playlist_id,
+                    track.get("title"),
+                    track.get("url"),
+                    track.get("extra"),
+                )
+                for track in tracks
+            ],
+        )
+
+    async def replace_by_playlist_id(
+        self, playlist_id: uuid.UUID, tracks: List[Dict[str, Any]]
+    ) -> bool:
+        """
+        Replaces all tracks of a playlist in a single transaction.
+
+        Nothing is written when the playlist already holds the same tracks in the same order.
+        Returns whether the tracks were replaced.
+        """
+        existing = await self.db_manager.query(
+            "SELECT title, url FROM track WHERE playlist_id = ? ORDER BY rowid",
+            (playlist_id,),
+        )
+        if existing == [(track.get("title"), track.get("url")) for track in tracks]:
+            return False
+
+        statements = [("DELETE FROM track WHERE playlist_id = ?", (playlist_id,))]
+        if tracks:
+            values = ", ".join(["(?, ?, ?)"] * len(tracks))
+            params = [
+                value
+                for track in tracks
+                for value in (playlist_id, track.get("title"), track.get("url"))
+            ]
+            statements.append(
+                (
+                    f"INSERT INTO track (playlist_id, title, url) VALUES {values}",
+                    tuple(params),
+                )
+            )
+
+        await self.db_manager.transaction(statements)
+        return True
+
+    async def create_many_by_playlist_name(
+        self, name: str, owner_id: int, tracks: List[Dict[str, Any]]
+    ) -> int:
+        """
+        Creates track records in the playlist with the given name and owner_id in a single statement.
+
+        Returns the number of created tracks, 0 if the playlist was not found.
+        """
+        if not tracks:
+            return 0
+
+        values = ", ".join(["(?, ?)"] * len(tracks))
+        params = [
+            value for track in tracks for value in (track.get("title"), track.get("url"))
+        ]
+        results = await self.db_manager.query(
+            f"""
+            INSERT INTO track (playlist_id, title, url)
+            SELECT p.playlist_id, t.title, t.url
+            FROM playlist AS p, (VALUES {values}) AS t(title, url)
+            WHERE p.playlist_id = (
+                SELECT playlist_id FROM playlist WHERE name = ? AND owner_id = ? LIMIT 1
+            )
+            RETURNING track_id
+            """,
+            (*params, name, owner_id),
+        )
+        return len(results)
+
     async def get(self, track_id: uuid.UUID) -> Optional[Dict[str, Any]]:
         """Retrieves a track record by track_id."""
-        results = await self.db_manager.query(
+        results = await self.db_manager.query_dicts(
             "SELECT * FROM track WHERE track_id = ?", (track_id,)
         )
         if results:
-            result = results[0]
-            columns = ["track_id", "playlist_id", "title", "url", "extra"]
-            return dict(zip(columns, result))
+            return results[0]
         return None
 
     async def update(
@@ -47,23 +127,19 @@ class Track:
         extra: Optional[Dict[str, Any]] = None,
     ) -> None:
         """Updates a track record by track_id."""
-        update_pairs = []
-        params = []
-        if title is not None:
-            update_pairs.append("title = ?")
-            params.append(title)
-        if url is not None:
-            update_pairs.append("url = ?")
-            params.append(url)
-        if extra is not None:
-            update_pairs.append("extra = ?")
-            params.append(extra)
-
-        if update_pairs:
-            params.append(track_id)
-            set_clause = ", ".join(update_pairs)
-            sql = f"UPDATE track SET {set_clause} WHERE track_id = ?"
-            await self.db_manager.query(sql, tuple(params))
+        updates = {
+            column: value
+            for column, value in (
+                ("title", title),
+                ("url", url),
+                ("extra", extra),
+            )
+            if value is not None
+        }
+
+        if updates:
+            sql = update_query("track", tuple(updates), "track_id")
+            await self.db_manager.query(sql, (*updates.values(), track_id))
 
     async def delete(self, track_id: uuid.UUID) -> None:
         """Deletes a track record by track_id."""
@@ -75,13 +151,31 @@ class Track:
             "DELETE FROM track WHERE playlist_id = ?", (playlist_id,)
         )
 
-    async def list_by_playlist(self, playlist_id: uuid.UUID) -> List[Dict[str, Any]]:
-        """Lists all tracks for a given playlist_id."""
+    async def count_by_playlist(self, playlist_id: uuid.UUID) -> int:
+        """Counts the tracks of a given playlist_id."""
         results = await self.db_manager.query(
-            "SELECT * FROM track WHERE playlist_id = ?", (playlist_id,)
+            "SELECT COUNT(*) FROM track WHERE playlist_id = ?", (playlist_id,)
+        )
+        return results[0][0] if results else 0
+
+    async def list_page_by_playlist(
+        self,
+        playlist_id: uuid.UUID,
+        limit: int,
+        offset: int = 0,
+        columns: str = "*",
+    ) -> List[Dict[str, Any]]:
+        """Lists one page of tracks for a given playlist_id in insertion order, limited to the given columns."""
+        return await self.db_manager.query_dicts(
+            f"SELECT {columns} FROM track WHERE playlist_id = ? ORDER BY rowid LIMIT ? OFFSET ?",
+            (playlist_id, limit, offset),
+        )
+
+    async def list_by_playlist(
+        self, playlist_id: uuid.UUID, shuffled: bool = False
+    ) -> List[Dict[str, Any]]:
+        """Lists all tracks for a given playlist_id, in insertion order or random order if shuffled."""
+        order = " ORDER BY random()" if shuffled else " ORDER BY rowid"
+        return await self.db_manager.query_dicts(
+            f"SELECT * FROM track WHERE playlist_id = ?{order}", (playlist_id,)
         )
-        tracks = []
-        columns = ["track_id", "playlist_id", "title", "url", "extra"]
-        for row in results:
-            tracks.append(dict(zip(columns, row)))
-        return tracks
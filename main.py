@@ -34,8 +34,9 @@ class MusicBot(commands.AutoShardedBot):
 
         try:
             # get all guilds from bot and insert to database
-            for guild in self.guilds:
-                await self.database.guild.create_or_ignore(guild.id)
+            await self.database.guild.create_many_or_ignore(
+                [guild.id for guild in self.guilds]
+            )
         except CatalogException:
             logger.error("Failed to insert guilds: ", exc_info=True)
 
@@ -61,6 +62,10 @@ class MusicBot(commands.AutoShardedBot):
         for file in self.cog_extensions:
             await self.load_extension(".".join(file.with_suffix("").parts))
 
+    async def close(self):
+        await super().close()
+        self.database.close()
+
 
 if __name__ == "__main__":
     bot = MusicBot(
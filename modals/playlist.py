@@ -1,4 +1,5 @@
 import traceback
+import asyncio
 import discord
 import logging
 import json
@@ -9,6 +10,10 @@ from discord import ui
 from database import DatabaseManager
 from typing import Optional, Any
 
+# Exports larger than this are decoded in a worker thread
+OFFLOAD_DECODE_THRESHOLD = 4 * 1024
+REQUIRED_SONG_KEYS = frozenset({"title", "url"})
+
 
 class ImportPlaylistModal(ui.Modal):
     """
@@ -128,10 +133,11 @@ class ImportPlaylistModal(ui.Modal):
         """
         playlist_data_str = self.playlist_data_input.value.strip()
         try:
-            compressed_data = base64.urlsafe_b64decode(playlist_data_str)
-            json_data = zlib.decompress(compressed_data).decode("utf-8")
-            tracks_obj = json.loads(json_data)
-            return tracks_obj
+            if len(playlist_data_str) > OFFLOAD_DECODE_THRESHOLD:
+                return await asyncio.to_thread(
+                    self._parse_playlist_data, playlist_data_str
+                )
+            return self._parse_playlist_data(playlist_data_str)
         except Exception as e:
             self.logger.error(f"Error decoding playlist data: {e}", exc_info=True)
             await interaction.followup.send(
@@ -140,6 +146,30 @@ class ImportPlaylistModal(ui.Modal):
             )
             return None
 
+    @staticmethod
+    def _parse_playlist_data(playlist_data_str: str) -> dict:
+        """
+        Decodes the exported playlist data and checks its structure.
+
+        Raises:
+            ValueError: If the decoded data is not a valid playlist export.
+        """
+        compressed_data = base64.urlsafe_b64decode(playlist_data_str)
+        json_data = zlib.decompress(compressed_data).decode("utf-8")
+        tracks_obj = json.loads(json_data)
+
+        if not isinstance(tracks_obj, dict):
+            raise ValueError("Playlist data must be an object")
+
+        songs = tracks_obj.get("songs", [])
+        if not isinstance(songs, list) or not all(
+            isinstance(song, dict) and REQUIRED_SONG_KEYS <= song.keys()
+            for song in songs
+        ):
+            raise ValueError("Playlist songs must each have a title and url")
+
+        return tracks_obj
+
     async def on_submit(self, interaction: discord.Interaction) -> None:
         """
         Handles modal submission. Validates inputs, decodes data, and imports the playlist.
@@ -165,17 +195,21 @@ class ImportPlaylistModal(ui.Modal):
 
             playlist_id = uuid.uuid4()
 
-            await self.database.playlist.create(
-                interaction.user.id, playlist_name, playlist_id=playlist_id
+            # The playlist and its tracks are created together, a failed
+            # import leaves no half-filled playlist behind
+            await self.database.playlist.create_with_tracks(
+                interaction.user.id,
+                playlist_name,
+                [
+                    {
+                        "title": song.get("title", "Unknown"),
+                        "url": song.get("url", "Unknown"),
+                    }
+                    for song in songs
+                ],
+                playlist_id=playlist_id,
             )
 
-            for song in songs:
-                await self.database.track.create(
-                    playlist_id,
-                    song.get("title", "Unknown"),
-                    song.get("url", "Unknown"),
-                )
-
             await interaction.followup.send(
                 f"Imported playlist `{playlist_name}` with {len(songs)} tracks. (Import logic not fully implemented yet!)",
                 ephemeral=True,
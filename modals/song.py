@@ -0,0 +1,98 @@
+import asyncio
+import discord
+import wavelink
+from discord import ui
+from database import DatabaseManager
+from modals.base import BaseModal
+from typing import Awaitable, Callable, List, Optional
+
+# Upper bound of queries per submission and of concurrent Lavalink searches
+MAX_SONG_QUERIES = 50
+SEARCH_CONCURRENCY = 8
+
+
+class AddSongsModal(BaseModal):
+    """
+    Modal for adding several songs to a playlist at once, one query per line.
+
+    The queries are searched concurrently and the found tracks are inserted in a single statement.
+    """
+
+    songs_input = ui.TextInput(
+        label="Songs",
+        style=discord.TextStyle.paragraph,
+        placeholder="One song title or url per line",
+        required=True,
+    )
+
+    def __init__(
+        self,
+        database: DatabaseManager,
+        playlist_name: str,
+        search: Callable[[str], Awaitable[Optional[wavelink.Search]]],
+    ):
+        """
+        Initializes the AddSongsModal.
+
+        Args:
+            database: The DatabaseManager instance.
+            playlist_name: The name of the playlist the songs are added to.
+            search: Coroutine function searching the tracks of a query.
+        """
+        super().__init__(database, title="Add Songs to Playlist", timeout=300)
+        self.playlist_name = playlist_name
+        self.search = search
+
+    async def _search_all(self, queries: List[str]) -> List[Optional[wavelink.Search]]:
+        """Searches every query concurrently, results are in query order."""
+        semaphore = asyncio.Semaphore(SEARCH_CONCURRENCY)
+
+        async def search(query: str) -> Optional[wavelink.Search]:
+            async with semaphore:
+                return await self.search(query)
+
+        return await asyncio.gather(*(search(query) for query in queries))
+
+    async def process_submission(self, interaction: discord.Interaction):
+        queries = [
+            line.strip() for line in self.songs_input.value.splitlines() if line.strip()
+        ]
+        if len(queries) > MAX_SONG_QUERIES:
+            await interaction.followup.send(
+                f"Please add at most {MAX_SONG_QUERIES} songs at once.", ephemeral=True
+            )
+            return
+
+        results = await self._search_all(queries)
+
+        tracks: List[wavelink.Playable] = []
+        missing: List[str] = []
+        for query, result in zip(queries, results):
+            if not result:
+                missing.append(query)
+            elif isinstance(result, wavelink.Playlist):
+                tracks.extend(result.tracks)
+            else:
+                tracks.append(result[0])
+
+        if not tracks:
+            await interaction.followup.send("No tracks found.", ephemeral=True)
+            return
+
+        created = await self.database.track.create_many_by_playlist_name(
+            self.playlist_name,
+            interaction.user.id,
+            [{"title": track.title, "url": track.uri} for track in tracks],
+        )
+        if not created:
+            await interaction.followup.send(
+                f"Playlist '{self.playlist_name}' not found", ephemeral=True
+            )
+            return
+
+        message = f"Added {created} songs to playlist '{self.playlist_name}'."
+        if missing:
+            message += "\nNo tracks found for: " + ", ".join(
+                f"`{query}`" for query in missing
+            )
+        await interaction.followup.send(message[:2000], ephemeral=True)
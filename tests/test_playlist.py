@@ -0,0 +1,50 @@
+import asyncio
+
+import pytest
+
+from database import DatabaseManager, on_setup_updated_tables
+
+
+@pytest.fixture
+def database(tmp_path):
+    path = str(tmp_path / "database.db")
+    asyncio.run(on_setup_updated_tables(path))
+    database = DatabaseManager(path)
+    yield database
+    database.close()
+
+
+def test_rename_playlist_with_tracks(database: DatabaseManager):
+    async def run():
+        playlist_id = await database.playlist.create_with_tracks(
+            1, "old", [{"title": "Song", "url": "https://example.com/song"}]
+        )
+
+        assert await database.playlist.rename("old", 1, "new")
+
+        playlist = await database.playlist.get_by_name_owner_id("new", 1)
+        assert playlist["playlist_id"] == playlist_id
+        assert not await database.playlist.get_by_name_owner_id("old", 1)
+        assert await database.track.count_by_playlist(playlist_id) == 1
+
+    asyncio.run(run())
+
+
+def test_rename_missing_playlist(database: DatabaseManager):
+    assert not asyncio.run(database.playlist.rename("missing", 1, "new"))
+
+
+def test_rename_onto_existing_name(database: DatabaseManager):
+    async def run():
+        track = {"title": "Song", "url": "https://example.com/song"}
+        await database.playlist.create_with_tracks(1, "old", [track])
+        await database.playlist.create_with_tracks(1, "new", [track])
+
+        assert not await database.playlist.rename("old", 1, "new")
+        assert await database.playlist.get_by_name_owner_id("old", 1)
+
+        # The guard only looks at the owner's own playlists
+        await database.playlist.create_with_tracks(2, "other", [track])
+        assert await database.playlist.rename("other", 2, "new")
+
+    asyncio.run(run())
@@ -1,6 +1,9 @@
 from views import PaginatedView
 
+import math
+import uuid
 import discord
+from database import DatabaseManager
 from typing import List, Dict, Any, cast
 
 
@@ -52,23 +55,57 @@ class PlaylistListView(PaginatedView):
 class PlaylistTrackView(PaginatedView):
     """
     View for displaying a paginated list of playlist tracks.
+
+    Only the tracks of the current page are kept, each page is fetched from the database when shown.
     """
 
-    def __init__(self, tracks: List[Dict[str, Any]], playlist_name: str):
-        super().__init__(tracks)
-        self.tracks = tracks
+    def __init__(
+        self,
+        database: DatabaseManager,
+        playlist_id: uuid.UUID,
+        playlist_name: str,
+        track_count: int,
+        first_page: List[Dict[str, Any]],
+    ):
+        super().__init__(first_page)
+        self.database = database
+        self.playlist_id = playlist_id
         self.playlist_name = playlist_name
+        self.track_count = track_count
+        self.tracks = first_page
+
+        self.page_count = max(1, math.ceil(track_count / self.items_per_page))
+        self.previous_button.disabled = True
+        self.next_button.disabled = self.page_count <= 1
+
+    async def update_buttons(self, interaction: discord.Interaction):
+        """
+        Fetches the tracks of the current page before updating the message.
+        """
+        self.tracks = await self.database.track.list_page_by_playlist(
+            self.playlist_id,
+            self.items_per_page,
+            self.current_page * self.items_per_page,
+            columns="title, url",
+        )
+        await super().update_buttons(interaction)
+
+    def get_current_page_items(self) -> List[Any]:
+        """
+        Returns the tracks fetched for the current page.
+        """
+        return self.tracks
 
     def create_embed(self) -> discord.Embed:
         """
         Creates the embed displaying the current page of playlist tracks.
         """
         embed = discord.Embed(
-            title=f"Playlist `{self.playlist_name}`, Songs: `{len(self.item_list)}`",
+            title=f"Playlist `{self.playlist_name}`, Songs: `{self.track_count}`",
             color=discord.Color.blue(),
         )
 
-        if not self.item_list:
+        if not self.track_count:
             embed.description = "No song in this playlist."
         else:
             track_lines = []